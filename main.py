@@ -1,9 +1,38 @@
 import asyncio
+import io
 import streamlit as st
 from agents.ceo_client.ceo_agent_client import get_ceo_agent
 import json
 from datetime import datetime
 
+# Strategic decision prompt, filled in with the user's context and numbered options
+_DECISION_TEMPLATE = """
+## Strategic Decision Required
+
+**Context:** {context}
+
+**Available Options:**
+{options}
+
+Please provide comprehensive strategic analysis including:
+1. Detailed evaluation of each option
+2. Risk/benefit analysis
+3. Strategic alignment assessment
+4. Resource requirement analysis
+5. Implementation timeline
+6. Recommended decision with reasoning
+7. Success metrics and monitoring plan
+"""
+
+@st.cache_data(show_spinner=False)
+def format_decision_options(options_input: str) -> str:
+    """Number the non-empty option lines for the decision prompt"""
+    options = (line.strip() for line in options_input.splitlines())
+    buf = io.StringIO()
+    for i, opt in enumerate(filter(None, options), 1):
+        buf.write(f"{i}. {opt}\n")
+    return buf.getvalue().rstrip("\n")
+
 async def initialize_app():
     """Initialize the CEO Agent application"""
     if 'ceo_agent' not in st.session_state:
@@ -142,25 +171,10 @@ def main():
         
         if st.button("🎯 Get Strategic Recommendation"):
             if decision_context and options_input:
-                options_list = [opt.strip() for opt in options_input.split('\n') if opt.strip()]
-                
-                decision_request = f"""
-                ## Strategic Decision Required
-                
-                **Context:** {decision_context}
-                
-                **Available Options:**
-                {chr(10).join([f"{i+1}. {opt}" for i, opt in enumerate(options_list)])}
-                
-                Please provide comprehensive strategic analysis including:
-                1. Detailed evaluation of each option
-                2. Risk/benefit analysis
-                3. Strategic alignment assessment
-                4. Resource requirement analysis
-                5. Implementation timeline
-                6. Recommended decision with reasoning
-                7. Success metrics and monitoring plan
-                """
+                decision_request = _DECISION_TEMPLATE.format(
+                    context=decision_context,
+                    options=format_decision_options(options_input)
+                )
                 
                 with st.spinner("Analyzing strategic decision..."):
                     try:
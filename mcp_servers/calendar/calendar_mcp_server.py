@@ -1,10 +1,12 @@
 import asyncio
+import collections
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from mcp.server.fastmcp import FastMCP
 import sqlite3
 import aiosqlite
+import orjson
 import os
 
 # Initialize MCP server
@@ -13,11 +15,69 @@ calendar_mcp = FastMCP("CEO Agent Calendar Server")
 # Calendar database path
 CALENDAR_DB_PATH = "./database/calendar.db"
 
+# Read-only URI so polling readers never contend with the event writer
+CALENDAR_DB_READONLY_URI = f"file:{CALENDAR_DB_PATH}?mode=ro"
+
+# Reminders marked as sent within this window are flushed in one UPDATE
+REMINDER_FLUSH_INTERVAL = 0.1
+
+_pending_sent_ids: List[int] = []
+_pending_sent_flush: Optional[asyncio.Task] = None
+
+# Row shape of calendar_events, in table column order
+CalendarEvent = collections.namedtuple(
+    "CalendarEvent",
+    "id agent_id title description start_datetime end_datetime event_type priority "
+    "attendees location reminder_minutes status created_at updated_at"
+)
+
+def _default(obj: Any) -> Any:
+    """orjson fallback for row namedtuples such as CalendarEvent"""
+    if hasattr(obj, "_asdict"):
+        return obj._asdict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    """Serialize a tool response with orjson (FastMCP tools must return str)"""
+    return orjson.dumps(payload, default=_default).decode()
+
+async def _flush_sent_reminders():
+    """Mark every queued reminder as sent with a single UPDATE"""
+    global _pending_sent_flush
+    
+    await asyncio.sleep(REMINDER_FLUSH_INTERVAL)
+    
+    reminder_ids = list(dict.fromkeys(_pending_sent_ids))
+    _pending_sent_ids.clear()
+    _pending_sent_flush = None
+    
+    placeholders = ",".join("?" * len(reminder_ids))
+    async with aiosqlite.connect(CALENDAR_DB_PATH) as db:
+        await db.execute(
+            f"UPDATE calendar_reminders SET sent = 1 WHERE id IN ({placeholders})",
+            reminder_ids
+        )
+        await db.commit()
+
+async def _queue_sent_reminders(reminder_ids: List[int]):
+    """Queue reminders for the next batched flush and wait for it to land"""
+    global _pending_sent_flush
+    
+    _pending_sent_ids.extend(reminder_ids)
+    if _pending_sent_flush is None:
+        _pending_sent_flush = asyncio.create_task(_flush_sent_reminders())
+    
+    await asyncio.shield(_pending_sent_flush)
+
 async def init_calendar_db():
     """Initialize calendar database"""
     os.makedirs(os.path.dirname(CALENDAR_DB_PATH), exist_ok=True)
     
     async with aiosqlite.connect(CALENDAR_DB_PATH) as db:
+        # WAL lets reminder polling read while events are being written
+        await db.execute("PRAGMA journal_mode=WAL")
+        await db.execute("PRAGMA wal_autocheckpoint=1000")
+        
         await db.execute("""
             CREATE TABLE IF NOT EXISTS calendar_events (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -33,13 +93,17 @@ async def init_calendar_db():
                 reminder_minutes INTEGER DEFAULT 15,
                 status TEXT DEFAULT 'scheduled',
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                INDEX(agent_id),
-                INDEX(start_datetime),
-                INDEX(event_type)
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
             )
         """)
         
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_events_agent_start ON calendar_events(agent_id, start_datetime)"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_events_type ON calendar_events(event_type)"
+        )
+        
         await db.execute("""
             CREATE TABLE IF NOT EXISTS calendar_reminders (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -49,13 +113,17 @@ async def init_calendar_db():
                 message TEXT NOT NULL,
                 sent BOOLEAN DEFAULT FALSE,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (event_id) REFERENCES calendar_events (id),
-                INDEX(agent_id),
-                INDEX(reminder_datetime),
-                INDEX(sent)
+                FOREIGN KEY (event_id) REFERENCES calendar_events (id)
             )
         """)
         
+        # Partial index keeps reminder polling limited to unsent rows
+        await db.execute(
+            """CREATE INDEX IF NOT EXISTS idx_rem_unsent 
+               ON calendar_reminders(agent_id, reminder_datetime) 
+               WHERE sent = 0"""
+        )
+        
         await db.commit()
 
 @calendar_mcp.tool()
@@ -89,7 +157,13 @@ async def create_event(
     try:
         attendees_list = json.loads(attendees) if attendees else []
         
+        if reminder_minutes > 0:
+            reminder_datetime = (datetime.fromisoformat(start_datetime.replace('Z', '+00:00')) - 
+                               timedelta(minutes=reminder_minutes)).isoformat()
+        
         async with aiosqlite.connect(CALENDAR_DB_PATH) as db:
+            # Event and reminder are written in a single write transaction
+            await db.execute("BEGIN IMMEDIATE")
             cursor = await db.execute(
                 """INSERT INTO calendar_events 
                    (agent_id, title, description, start_datetime, end_datetime, 
@@ -100,22 +174,19 @@ async def create_event(
             )
             
             event_id = cursor.lastrowid
-            await db.commit()
             
             # Create reminder if requested
             if reminder_minutes > 0:
-                reminder_datetime = (datetime.fromisoformat(start_datetime.replace('Z', '+00:00')) - 
-                                   timedelta(minutes=reminder_minutes)).isoformat()
-                
                 await db.execute(
                     """INSERT INTO calendar_reminders 
                        (event_id, agent_id, reminder_datetime, message) 
                        VALUES (?, ?, ?, ?)""",
                     (event_id, agent_id, reminder_datetime, f"Reminder: {title} in {reminder_minutes} minutes")
                 )
-                await db.commit()
+            
+            await db.commit()
         
-        return json.dumps({
+        return _dumps({
             "success": True,
             "event_id": event_id,
             "message": f"Event '{title}' created successfully",
@@ -124,7 +195,7 @@ async def create_event(
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to create event: {str(e)}"
         })
@@ -148,7 +219,7 @@ async def get_events(
         limit: Maximum number of events to return
     """
     try:
-        async with aiosqlite.connect(CALENDAR_DB_PATH) as db:
+        async with aiosqlite.connect(CALENDAR_DB_READONLY_URI, uri=True) as db:
             query = "SELECT * FROM calendar_events WHERE agent_id = ?"
             params = [agent_id]
             
@@ -168,33 +239,21 @@ async def get_events(
             params.append(limit)
             
             async with db.execute(query, params) as cursor:
-                events = []
-                async for row in cursor:
-                    events.append({
-                        "id": row[0],
-                        "agent_id": row[1],
-                        "title": row[2],
-                        "description": row[3],
-                        "start_datetime": row[4],
-                        "end_datetime": row[5],
-                        "event_type": row[6],
-                        "priority": row[7],
-                        "attendees": json.loads(row[8]) if row[8] else [],
-                        "location": row[9],
-                        "reminder_minutes": row[10],
-                        "status": row[11],
-                        "created_at": row[12],
-                        "updated_at": row[13]
-                    })
+                rows = await cursor.fetchall()
+            
+            events = [
+                CalendarEvent(*row[:8], json.loads(row[8]) if row[8] else [], *row[9:])
+                for row in rows
+            ]
         
-        return json.dumps({
+        return _dumps({
             "success": True,
             "events": events,
             "count": len(events)
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to get events: {str(e)}"
         })
@@ -223,7 +282,7 @@ async def update_event_status(
             )
             await db.commit()
         
-        return json.dumps({
+        return _dumps({
             "success": True,
             "event_id": event_id,
             "new_status": status,
@@ -231,7 +290,7 @@ async def update_event_status(
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to update event status: {str(e)}"
         })
@@ -252,40 +311,72 @@ async def get_upcoming_reminders(
         cutoff_time = (datetime.now() + timedelta(hours=hours_ahead)).isoformat()
         current_time = datetime.now().isoformat()
         
-        async with aiosqlite.connect(CALENDAR_DB_PATH) as db:
+        async with aiosqlite.connect(CALENDAR_DB_READONLY_URI, uri=True) as db:
             async with db.execute(
-                """SELECT r.*, e.title, e.start_datetime 
+                """SELECT r.id, r.event_id, r.reminder_datetime, r.message, 
+                          e.title, e.start_datetime 
                    FROM calendar_reminders r
                    JOIN calendar_events e ON r.event_id = e.id
                    WHERE r.agent_id = ? 
                    AND r.reminder_datetime BETWEEN ? AND ?
-                   AND r.sent = FALSE
+                   AND r.sent = 0
                    ORDER BY r.reminder_datetime ASC""",
                 (agent_id, current_time, cutoff_time)
             ) as cursor:
-                reminders = []
-                async for row in cursor:
-                    reminders.append({
-                        "reminder_id": row[0],
-                        "event_id": row[1],
-                        "reminder_datetime": row[3],
-                        "message": row[4],
-                        "event_title": row[6],
-                        "event_start": row[7]
-                    })
+                rows = await cursor.fetchall()
+            
+            reminders = [
+                {
+                    "reminder_id": row[0],
+                    "event_id": row[1],
+                    "reminder_datetime": row[2],
+                    "message": row[3],
+                    "event_title": row[4],
+                    "event_start": row[5]
+                }
+                for row in rows
+            ]
         
-        return json.dumps({
+        return _dumps({
             "success": True,
             "reminders": reminders,
             "count": len(reminders)
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to get reminders: {str(e)}"
         })
 
+@calendar_mcp.tool()
+async def mark_reminders_sent(
+    reminder_ids: str
+) -> str:
+    """
+    Mark reminders as sent
+    
+    Args:
+        reminder_ids: JSON array of reminder IDs that have fired
+    """
+    try:
+        ids = [int(reminder_id) for reminder_id in json.loads(reminder_ids)]
+        
+        if ids:
+            await _queue_sent_reminders(ids)
+        
+        return _dumps({
+            "success": True,
+            "reminder_ids": ids,
+            "count": len(ids)
+        })
+        
+    except Exception as e:
+        return _dumps({
+            "success": False,
+            "error": f"Failed to mark reminders sent: {str(e)}"
+        })
+
 # Initialize database on startup
 async def startup():
     await init_calendar_db()
@@ -1,12 +1,12 @@
 import asyncio
-import json
 import sqlite3
-from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from mcp.server.fastmcp import FastMCP
 from contextlib import asynccontextmanager
 import aiosqlite
+import orjson
 import os
+import time
 
 # Initialize MCP server
 database_mcp = FastMCP("CEO Agent Database Server")
@@ -14,75 +14,225 @@ database_mcp = FastMCP("CEO Agent Database Server")
 # Database path from environment
 DB_PATH = os.getenv("DATABASE_URL", "sqlite:///./ceo_agent_system.db").replace("sqlite:///", "")
 
+_loads = orjson.loads
+
+def _dumps(obj: Any) -> str:
+    """Serialize with orjson (FastMCP tools and JSON columns expect str)"""
+    return orjson.dumps(obj).decode()
+
+# Seconds-resolution prefix of the last timestamp, rebuilt only when the second changes
+_last_sec = 0
+_last_prefix = ""
+
+def _iso_now() -> str:
+    """Current local time in ISO format, reusing the cached seconds prefix"""
+    global _last_sec, _last_prefix
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    if sec != _last_sec:
+        _last_sec = sec
+        _last_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+    return f"{_last_prefix}.{ns // 1000:06d}"
+
+# Connection tuning applied once when the shared connection is opened
+DB_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Composite indexes matching the WHERE/ORDER BY of the hot queries
+DB_INDEXES = (
+    # retrieve_agent_memories: filter and ordering served straight from the index
+    """CREATE INDEX IF NOT EXISTS ix_mem_lookup 
+       ON agent_memory(agent_id, importance_score DESC, timestamp DESC)""",
+    # get_agent_analytics: index-only scans for both statistics blocks
+    """CREATE INDEX IF NOT EXISTS ix_mem_stats 
+       ON agent_memory(agent_id, timestamp, memory_type, importance_score)""",
+    """CREATE INDEX IF NOT EXISTS ix_int_stats 
+       ON agent_interactions(agent_id, timestamp, interaction_type, success, processing_time_ms)""",
+    """CREATE INDEX IF NOT EXISTS ix_dec_agent_time 
+       ON agent_decisions(agent_id, timestamp)""",
+    """CREATE INDEX IF NOT EXISTS ix_know_lookup 
+       ON agent_knowledge(agent_id, knowledge_type, last_accessed)""",
+)
+
+# Prepared statements kept per connection by sqlite3, keyed by SQL text
+DB_STATEMENT_CACHE_SIZE = 64
+
+# Shared connection reused by every tool call
+_db: Optional[aiosqlite.Connection] = None
+
+# SQLite allows a single writer, so writes queue here instead of on SQLITE_BUSY
+_WRITE_LOCK = asyncio.Lock()
+
+async def get_db() -> aiosqlite.Connection:
+    """Return the shared database connection, opening it on first use"""
+    global _db
+    if _db is None:
+        db = await aiosqlite.connect(DB_PATH, cached_statements=DB_STATEMENT_CACHE_SIZE)
+        for pragma in DB_PRAGMAS:
+            await db.execute(pragma)
+        _db = db
+    return _db
+
+async def close_db():
+    """Close the shared database connection"""
+    global _db
+    if _db is not None:
+        # Let SQLite refresh planner statistics for the queries it has seen
+        await _db.execute("PRAGMA optimize")
+        await _db.close()
+        _db = None
+
+# Hot statements live at module level so every call reuses the same SQL text
+# and therefore the same prepared statement
+INSERT_MEMORY_SQL = """INSERT INTO agent_memory 
+   (agent_id, memory_type, content, importance_score) 
+   VALUES (?, ?, ?, ?)"""
+
+INSERT_KNOWLEDGE_SQL = """INSERT INTO agent_knowledge 
+   (agent_id, knowledge_type, content, source, confidence_score) 
+   VALUES (?, ?, ?, ?, ?)"""
+
+INSERT_INTERACTION_SQL = """INSERT INTO agent_interactions 
+   (agent_id, interaction_type, input_data, output_data, processing_time_ms, success) 
+   VALUES (?, ?, ?, ?, ?, ?)"""
+
+INSERT_DECISION_SQL = """INSERT INTO agent_decisions 
+   (agent_id, decision_context, options_analyzed, decision_made, reasoning, outcome) 
+   VALUES (?, ?, ?, ?, ?, ?)"""
+
+# Interaction and memory statistics in one round-trip, rendered as JSON arrays by SQLite
+ANALYTICS_SQL = """WITH i AS (
+       SELECT interaction_type, COUNT(*) AS total_count, 
+              AVG(processing_time_ms) AS avg_processing_time_ms,
+              SUM(CASE WHEN success THEN 1 ELSE 0 END) AS success_count
+       FROM agent_interactions 
+       WHERE agent_id = :agent_id AND timestamp > datetime('now', :window) 
+       GROUP BY interaction_type
+   ), m AS (
+       SELECT memory_type, COUNT(*) AS count, AVG(importance_score) AS avg_importance
+       FROM agent_memory 
+       WHERE agent_id = :agent_id AND timestamp > datetime('now', :window)
+       GROUP BY memory_type
+   )
+   SELECT 
+       (SELECT json_group_array(json_object(
+            'interaction_type', interaction_type,
+            'total_count', total_count,
+            'avg_processing_time_ms', avg_processing_time_ms,
+            'success_count', success_count,
+            'success_rate', success_count * 100.0 / total_count
+        )) FROM i),
+       (SELECT json_group_array(json_object(
+            'memory_type', memory_type,
+            'count', count,
+            'avg_importance', avg_importance
+        )) FROM m)"""
+
+async def _insert_many(sql: str, rows: List[tuple]):
+    """Insert rows in a single transaction so the batch pays for one commit"""
+    db = await get_db()
+    async with _WRITE_LOCK:
+        try:
+            await db.execute("BEGIN")
+            await db.executemany(sql, rows)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+def _to_json(data: Any) -> str:
+    """Normalize a JSON string or object into a JSON column value"""
+    if isinstance(data, str):
+        # Already JSON: validate only and store the caller's text verbatim
+        _loads(data)
+        return data
+    return _dumps(data)
+
+def _json_text(data: Any) -> str:
+    """Like _to_json, but trusts object/array text after a structural check"""
+    if isinstance(data, str) and data[:1] in ("{", "["):
+        return data
+    return _to_json(data)
+
+def _memory_row(agent_id: str, memory_type: str, content: Any, importance_score: int = 1) -> tuple:
+    return (agent_id, memory_type, _to_json(content), importance_score)
+
+def _knowledge_row(agent_id: str, knowledge_type: str, content: Any,
+                   source: str = "unknown", confidence_score: float = 0.5) -> tuple:
+    return (agent_id, knowledge_type, _to_json(content), source, confidence_score)
+
+def _interaction_row(agent_id: str, interaction_type: str, input_data: Any, output_data: Any,
+                     processing_time_ms: int = 0, success: bool = True) -> tuple:
+    # Interaction logs are the hottest write path, so skip full JSON validation
+    return (agent_id, interaction_type, _json_text(input_data), _json_text(output_data),
+            processing_time_ms, success)
+
 async def init_database():
     """Initialize database with required tables"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Agent memory table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS agent_memory (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                agent_id TEXT NOT NULL,
-                memory_type TEXT NOT NULL,
-                content JSON NOT NULL,
-                importance_score INTEGER DEFAULT 1,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                INDEX(agent_id),
-                INDEX(memory_type),
-                INDEX(timestamp)
-            )
-        """)
-        
-        # Agent decisions table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS agent_decisions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                agent_id TEXT NOT NULL,
-                decision_context TEXT NOT NULL,
-                options_analyzed JSON,
-                decision_made TEXT NOT NULL,
-                reasoning TEXT,
-                outcome TEXT,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                INDEX(agent_id),
-                INDEX(timestamp)
-            )
-        """)
-        
-        # Agent knowledge base
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS agent_knowledge (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                agent_id TEXT NOT NULL,
-                knowledge_type TEXT NOT NULL,
-                content JSON NOT NULL,
-                source TEXT,
-                confidence_score REAL DEFAULT 0.5,
-                last_accessed DATETIME DEFAULT CURRENT_TIMESTAMP,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                INDEX(agent_id),
-                INDEX(knowledge_type),
-                INDEX(source)
-            )
-        """)
-        
-        # Agent interactions log
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS agent_interactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                agent_id TEXT NOT NULL,
-                interaction_type TEXT NOT NULL,
-                input_data JSON,
-                output_data JSON,
-                processing_time_ms INTEGER,
-                success BOOLEAN DEFAULT TRUE,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                INDEX(agent_id),
-                INDEX(interaction_type),
-                INDEX(timestamp)
-            )
-        """)
-        
-        await db.commit()
+    db = await get_db()
+    
+    # Agent memory table
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS agent_memory (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            agent_id TEXT NOT NULL,
+            memory_type TEXT NOT NULL,
+            content JSON NOT NULL,
+            importance_score INTEGER DEFAULT 1,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    # Agent decisions table
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS agent_decisions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            agent_id TEXT NOT NULL,
+            decision_context TEXT NOT NULL,
+            options_analyzed JSON,
+            decision_made TEXT NOT NULL,
+            reasoning TEXT,
+            outcome TEXT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    # Agent knowledge base
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS agent_knowledge (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            agent_id TEXT NOT NULL,
+            knowledge_type TEXT NOT NULL,
+            content JSON NOT NULL,
+            source TEXT,
+            confidence_score REAL DEFAULT 0.5,
+            last_accessed DATETIME DEFAULT CURRENT_TIMESTAMP,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    # Agent interactions log
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS agent_interactions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            agent_id TEXT NOT NULL,
+            interaction_type TEXT NOT NULL,
+            input_data JSON,
+            output_data JSON,
+            processing_time_ms INTEGER,
+            success BOOLEAN DEFAULT TRUE,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    for index in DB_INDEXES:
+        await db.execute(index)
+    
+    await db.commit()
 
 @database_mcp.tool()
 async def store_agent_memory(
@@ -101,35 +251,58 @@ async def store_agent_memory(
         importance_score: Importance from 1-5
     """
     try:
-        content_dict = json.loads(content) if isinstance(content, str) else content
+        await _insert_many(
+            INSERT_MEMORY_SQL,
+            [_memory_row(agent_id, memory_type, content, importance_score)]
+        )
         
-        async with aiosqlite.connect(DB_PATH) as db:
-            await db.execute(
-                """INSERT INTO agent_memory 
-                   (agent_id, memory_type, content, importance_score) 
-                   VALUES (?, ?, ?, ?)""",
-                (agent_id, memory_type, json.dumps(content_dict), importance_score)
-            )
-            await db.commit()
-            
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Memory stored for agent {agent_id}",
             "memory_type": memory_type
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to store memory: {str(e)}"
         })
 
+@database_mcp.tool()
+async def store_agent_memories_batch(
+    agent_id: str,
+    items: str
+) -> str:
+    """
+    Store multiple agent memories in a single transaction
+    
+    Args:
+        agent_id: ID of the agent
+        items: JSON array of objects with memory_type, content and optional importance_score
+    """
+    try:
+        rows = [_memory_row(agent_id, **item) for item in _loads(items)]
+        await _insert_many(INSERT_MEMORY_SQL, rows)
+        
+        return _dumps({
+            "success": True,
+            "message": f"{len(rows)} memories stored for agent {agent_id}",
+            "count": len(rows)
+        })
+        
+    except Exception as e:
+        return _dumps({
+            "success": False,
+            "error": f"Failed to store memories: {str(e)}"
+        })
+
 @database_mcp.tool()
 async def retrieve_agent_memories(
     agent_id: str,
     memory_type: str = "",
     limit: int = 50,
-    min_importance: int = 1
+    min_importance: int = 1,
+    fields: str = ""
 ) -> str:
     """
     Retrieve agent memories from database
@@ -139,42 +312,62 @@ async def retrieve_agent_memories(
         memory_type: Optional filter by memory type
         limit: Maximum number of memories to retrieve
         min_importance: Minimum importance score
+        fields: Optional comma-separated content fields (or JSON paths) to return
+                instead of the full content
     """
     try:
-        async with aiosqlite.connect(DB_PATH) as db:
-            query = """
-                SELECT id, memory_type, content, importance_score, timestamp
-                FROM agent_memory 
-                WHERE agent_id = ? AND importance_score >= ?
-            """
-            params = [agent_id, min_importance]
-            
-            if memory_type:
-                query += " AND memory_type = ?"
-                params.append(memory_type)
-            
-            query += " ORDER BY importance_score DESC, timestamp DESC LIMIT ?"
-            params.append(limit)
-            
-            async with db.execute(query, params) as cursor:
-                memories = []
-                async for row in cursor:
-                    memories.append({
-                        "id": row[0],
-                        "memory_type": row[1],
-                        "content": json.loads(row[2]),
-                        "importance_score": row[3],
-                        "timestamp": row[4]
-                    })
+        db = await get_db()
+        
+        # Project requested fields inside SQLite so full content never reaches Python
+        field_names = [field.strip() for field in fields.split(",") if field.strip()]
+        if field_names:
+            content_column = "json_object({})".format(
+                ", ".join("?, json_extract(content, ?)" for _ in field_names)
+            )
+            params = []
+            for field in field_names:
+                params += [field, field if field.startswith("$") else f"$.{field}"]
+        else:
+            content_column = "content"
+            params = []
+        
+        query = f"""
+            SELECT id, memory_type, {content_column}, importance_score, timestamp
+            FROM agent_memory 
+            WHERE agent_id = ? AND importance_score >= ?
+        """
+        params += [agent_id, min_importance]
+        
+        if memory_type:
+            query += " AND memory_type = ?"
+            params.append(memory_type)
+        
+        query += " ORDER BY importance_score DESC, timestamp DESC LIMIT ?"
+        params.append(limit)
+        
+        async with db.execute(query, params) as cursor:
+            rows = await cursor.fetchall()
         
-        return json.dumps({
+        # Stored content is already JSON, so splice it into the response as-is
+        memories = [
+            {
+                "id": row[0],
+                "memory_type": row[1],
+                "content": orjson.Fragment(row[2]),
+                "importance_score": row[3],
+                "timestamp": row[4]
+            }
+            for row in rows
+        ]
+        
+        return _dumps({
             "success": True,
             "memories": memories,
             "count": len(memories)
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to retrieve memories: {str(e)}"
         })
@@ -200,24 +393,18 @@ async def store_agent_decision(
         outcome: Outcome of the decision (if known)
     """
     try:
-        options_dict = json.loads(options_analyzed) if isinstance(options_analyzed, str) else options_analyzed
+        await _insert_many(
+            INSERT_DECISION_SQL,
+            [(agent_id, decision_context, _to_json(options_analyzed), decision_made, reasoning, outcome)]
+        )
         
-        async with aiosqlite.connect(DB_PATH) as db:
-            await db.execute(
-                """INSERT INTO agent_decisions 
-                   (agent_id, decision_context, options_analyzed, decision_made, reasoning, outcome) 
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (agent_id, decision_context, json.dumps(options_dict), decision_made, reasoning, outcome)
-            )
-            await db.commit()
-            
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Decision stored for agent {agent_id}"
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to store decision: {str(e)}"
         })
@@ -241,25 +428,47 @@ async def store_agent_knowledge(
         confidence_score: Confidence in knowledge accuracy (0.0-1.0)
     """
     try:
-        content_dict = json.loads(content) if isinstance(content, str) else content
+        await _insert_many(
+            INSERT_KNOWLEDGE_SQL,
+            [_knowledge_row(agent_id, knowledge_type, content, source, confidence_score)]
+        )
         
-        async with aiosqlite.connect(DB_PATH) as db:
-            await db.execute(
-                """INSERT INTO agent_knowledge 
-                   (agent_id, knowledge_type, content, source, confidence_score) 
-                   VALUES (?, ?, ?, ?, ?)""",
-                (agent_id, knowledge_type, json.dumps(content_dict), source, confidence_score)
-            )
-            await db.commit()
-            
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Knowledge stored for agent {agent_id}",
             "knowledge_type": knowledge_type
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
+            "success": False,
+            "error": f"Failed to store knowledge: {str(e)}"
+        })
+
+@database_mcp.tool()
+async def store_agent_knowledge_batch(
+    agent_id: str,
+    items: str
+) -> str:
+    """
+    Store multiple knowledge entries in a single transaction
+    
+    Args:
+        agent_id: ID of the agent
+        items: JSON array of objects with knowledge_type, content and optional source, confidence_score
+    """
+    try:
+        rows = [_knowledge_row(agent_id, **item) for item in _loads(items)]
+        await _insert_many(INSERT_KNOWLEDGE_SQL, rows)
+        
+        return _dumps({
+            "success": True,
+            "message": f"{len(rows)} knowledge entries stored for agent {agent_id}",
+            "count": len(rows)
+        })
+        
+    except Exception as e:
+        return _dumps({
             "success": False,
             "error": f"Failed to store knowledge: {str(e)}"
         })
@@ -285,30 +494,52 @@ async def log_agent_interaction(
         success: Whether interaction was successful
     """
     try:
-        input_dict = json.loads(input_data) if isinstance(input_data, str) else input_data
-        output_dict = json.loads(output_data) if isinstance(output_data, str) else output_data
+        await _insert_many(
+            INSERT_INTERACTION_SQL,
+            [_interaction_row(agent_id, interaction_type, input_data, output_data,
+                              processing_time_ms, success)]
+        )
         
-        async with aiosqlite.connect(DB_PATH) as db:
-            await db.execute(
-                """INSERT INTO agent_interactions 
-                   (agent_id, interaction_type, input_data, output_data, processing_time_ms, success) 
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (agent_id, interaction_type, json.dumps(input_dict), 
-                 json.dumps(output_dict), processing_time_ms, success)
-            )
-            await db.commit()
-            
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Interaction logged for agent {agent_id}"
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to log interaction: {str(e)}"
         })
 
+@database_mcp.tool()
+async def log_agent_interactions_batch(
+    agent_id: str,
+    items: str
+) -> str:
+    """
+    Log multiple agent interactions in a single transaction
+    
+    Args:
+        agent_id: ID of the agent
+        items: JSON array of objects with interaction_type, input_data, output_data
+               and optional processing_time_ms, success
+    """
+    try:
+        rows = [_interaction_row(agent_id, **item) for item in _loads(items)]
+        await _insert_many(INSERT_INTERACTION_SQL, rows)
+        
+        return _dumps({
+            "success": True,
+            "message": f"{len(rows)} interactions logged for agent {agent_id}",
+            "count": len(rows)
+        })
+        
+    except Exception as e:
+        return _dumps({
+            "success": False,
+            "error": f"Failed to log interactions: {str(e)}"
+        })
+
 @database_mcp.tool()
 async def get_agent_analytics(
     agent_id: str,
@@ -322,69 +553,56 @@ async def get_agent_analytics(
         days: Number of days to analyze
     """
     try:
-        cutoff_date = datetime.now() - timedelta(days=days)
+        db = await get_db()
         
-        async with aiosqlite.connect(DB_PATH) as db:
-            # Get interaction statistics
-            async with db.execute(
-                """SELECT interaction_type, COUNT(*), AVG(processing_time_ms), 
-                   SUM(CASE WHEN success THEN 1 ELSE 0 END) as success_count
-                   FROM agent_interactions 
-                   WHERE agent_id = ? AND timestamp > ? 
-                   GROUP BY interaction_type""",
-                (agent_id, cutoff_date.isoformat())
-            ) as cursor:
-                interactions = []
-                async for row in cursor:
-                    interactions.append({
-                        "interaction_type": row[0],
-                        "total_count": row[1],
-                        "avg_processing_time_ms": row[2],
-                        "success_count": row[3],
-                        "success_rate": (row[3] / row[1]) * 100 if row[1] > 0 else 0
-                    })
-            
-            # Get memory statistics  
-            async with db.execute(
-                """SELECT memory_type, COUNT(*), AVG(importance_score)
-                   FROM agent_memory 
-                   WHERE agent_id = ? AND timestamp > ?
-                   GROUP BY memory_type""",
-                (agent_id, cutoff_date.isoformat())
-            ) as cursor:
-                memory_stats = []
-                async for row in cursor:
-                    memory_stats.append({
-                        "memory_type": row[0],
-                        "count": row[1], 
-                        "avg_importance": row[2]
-                    })
+        async with db.execute(
+            ANALYTICS_SQL,
+            {"agent_id": agent_id, "window": f"-{int(days)} days"}
+        ) as cursor:
+            interactions, memory_stats = await cursor.fetchone()
         
         analytics = {
             "agent_id": agent_id,
             "analysis_period_days": days,
-            "interactions": interactions,
-            "memory_statistics": memory_stats,
-            "generated_at": datetime.now().isoformat()
+            "interactions": orjson.Fragment(interactions),
+            "memory_statistics": orjson.Fragment(memory_stats),
+            "generated_at": _iso_now()
         }
         
-        return json.dumps({
+        return _dumps({
             "success": True,
             "analytics": analytics
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to generate analytics: {str(e)}"
         })
 
 # Initialize database on startup
 async def startup():
-    await init_database()
+    try:
+        await init_database()
+    except Exception as e:
+        # Never boot on a partial schema
+        print(f"❌ Database schema initialization failed: {e}")
+        raise
+    
+    # Planner statistics so the composite indexes are picked over table scans
+    db = await get_db()
+    await db.execute("ANALYZE")
+    await db.execute("PRAGMA analysis_limit=1000")
+    await db.execute("PRAGMA optimize")
     print("✅ Database MCP Server initialized")
 
+async def shutdown():
+    await close_db()
+
 if __name__ == "__main__":
     print("🗄️ Starting Database MCP Server...")
     asyncio.run(startup())
-    asyncio.run(database_mcp.run())
\ No newline at end of file
+    try:
+        asyncio.run(database_mcp.run())
+    finally:
+        asyncio.run(shutdown())
\ No newline at end of file
@@ -1,8 +1,11 @@
 import asyncio
-import json
+import atexit
+import collections
 import logging
+import logging.handlers
+import queue
+import orjson
 import structlog
-from datetime import datetime
 from typing import Dict, Any
 from mcp.server.fastmcp import FastMCP
 import os
@@ -10,6 +13,12 @@ import os
 # Initialize MCP server
 logging_mcp = FastMCP("CEO Agent Logging Server")
 
+_loads = orjson.loads
+
+def _dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize with orjson; also used as structlog's JSON serializer"""
+    return orjson.dumps(obj, default=kwargs.get("default")).decode()
+
 # Configure structured logging
 structlog.configure(
     processors=[
@@ -21,7 +30,7 @@ structlog.configure(
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=_dumps)
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -34,6 +43,34 @@ business_logger = structlog.get_logger("business_agent")
 operations_logger = structlog.get_logger("operations_agent")
 system_logger = structlog.get_logger("system")
 
+# Level name -> logger method; unknown levels fall back to info
+_LOG_METHODS = {
+    "debug": "debug",
+    "info": "info",
+    "warning": "warning",
+    "error": "error",
+    "critical": "critical"
+}
+
+# Agent ID -> logger, resolved once per agent
+_AGENT_LOGGERS: Dict[str, Any] = {}
+
+def _resolve_logger(agent_id: str):
+    """Pick the logger for an agent from its ID"""
+    agent_key = agent_id.lower()
+    if "business" in agent_key:
+        return business_logger
+    if "operations" in agent_key:
+        return operations_logger
+    return ceo_logger
+
+def _logger_for(agent_id: str):
+    """Return the cached logger for an agent"""
+    logger = _AGENT_LOGGERS.get(agent_id)
+    if logger is None:
+        logger = _AGENT_LOGGERS[agent_id] = _resolve_logger(agent_id)
+    return logger
+
 # Configure file handlers
 log_level = os.getenv("LOG_LEVEL", "INFO")
 log_dir = "./logs"
@@ -46,11 +83,46 @@ file_handler.setFormatter(logging.Formatter(
     '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 ))
 
-# Add handler to root logger
+# Log calls only enqueue records; a listener thread does the blocking file writes
+log_queue = queue.SimpleQueue()
+queue_listener = logging.handlers.QueueListener(
+    log_queue, file_handler, respect_handler_level=True
+)
+queue_listener.start()
+atexit.register(queue_listener.stop)
+
+class RecentLogHandler(logging.Handler):
+    """Keep the most recent log records in memory for get_recent_logs"""
+    
+    def __init__(self, capacity: int = 10000):
+        super().__init__()
+        self.records = collections.deque(maxlen=capacity)
+    
+    def emit(self, record: logging.LogRecord):
+        # Parsing is deferred to get_recent_logs so logging stays cheap
+        self.records.append((record.name, record.levelname.lower(), record.getMessage()))
+
+recent_log_handler = RecentLogHandler()
+recent_log_handler.setLevel(getattr(logging, log_level))
+
+# Add handlers to root logger
 root_logger = logging.getLogger()
-root_logger.addHandler(file_handler)
+root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+root_logger.addHandler(recent_log_handler)
 root_logger.setLevel(getattr(logging, log_level))
 
+def _parse_log_record(name: str, levelname: str, message: str) -> Dict[str, Any]:
+    """Turn a buffered record into a dict, unpacking structlog's JSON events"""
+    try:
+        entry = _loads(message)
+    except orjson.JSONDecodeError:
+        entry = None
+    if not isinstance(entry, dict):
+        entry = {"event": message}
+    entry.setdefault("logger", name)
+    entry.setdefault("level", levelname)
+    return entry
+
 @logging_mcp.tool()
 async def log_agent_activity(
     agent_id: str,
@@ -70,37 +142,20 @@ async def log_agent_activity(
         metadata: Additional metadata as JSON string
     """
     try:
-        metadata_dict = json.loads(metadata) if metadata else {}
+        metadata_dict = _loads(metadata) if metadata else {}
         
         # Select appropriate logger based on agent
-        if "business" in agent_id.lower():
-            logger = business_logger
-        elif "operations" in agent_id.lower():
-            logger = operations_logger
-        else:
-            logger = ceo_logger
-        
-        # Log with structured data
-        log_data = {
-            "agent_id": agent_id,
-            "activity_type": activity_type,
-            "timestamp": datetime.now().isoformat(),
-            **metadata_dict
-        }
+        logger = _logger_for(agent_id)
         
-        # Log at appropriate level
-        if level.lower() == "debug":
-            logger.debug(message, **log_data)
-        elif level.lower() == "warning":
-            logger.warning(message, **log_data)
-        elif level.lower() == "error":
-            logger.error(message, **log_data)
-        elif level.lower() == "critical":
-            logger.critical(message, **log_data)
-        else:
-            logger.info(message, **log_data)
+        # Log at appropriate level; metadata stays nested instead of being flattened
+        getattr(logger, _LOG_METHODS.get(level.lower(), "info"))(
+            message,
+            agent_id=agent_id,
+            activity_type=activity_type,
+            meta=metadata_dict
+        )
         
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Activity logged for {agent_id}",
             "log_level": level,
@@ -110,7 +165,7 @@ async def log_agent_activity(
     except Exception as e:
         system_logger.error(f"Failed to log activity: {str(e)}", 
                            agent_id=agent_id, activity_type=activity_type)
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to log activity: {str(e)}"
         })
@@ -134,29 +189,28 @@ async def log_agent_performance(
         details: Additional details as JSON string
     """
     try:
-        details_dict = json.loads(details) if details else {}
-        
-        performance_data = {
-            "agent_id": agent_id,
-            "operation": operation,
-            "duration_ms": duration_ms,
-            "success": success,
-            "timestamp": datetime.now().isoformat(),
-            **details_dict
-        }
+        details_dict = _loads(details) if details else {}
         
         if success:
             ceo_logger.info(
                 f"Operation completed: {operation}",
-                **performance_data
+                agent_id=agent_id,
+                operation=operation,
+                duration_ms=duration_ms,
+                success=success,
+                details=details_dict
             )
         else:
             ceo_logger.warning(
                 f"Operation failed: {operation}",
-                **performance_data
+                agent_id=agent_id,
+                operation=operation,
+                duration_ms=duration_ms,
+                success=success,
+                details=details_dict
             )
         
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Performance logged for {agent_id}",
             "operation": operation,
@@ -165,7 +219,7 @@ async def log_agent_performance(
         
     except Exception as e:
         system_logger.error(f"Failed to log performance: {str(e)}")
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to log performance: {str(e)}"
         })
@@ -189,25 +243,16 @@ async def log_system_event(
         metadata: Additional metadata as JSON string
     """
     try:
-        metadata_dict = json.loads(metadata) if metadata else {}
+        metadata_dict = _loads(metadata) if metadata else {}
         
-        event_data = {
-            "event_type": event_type,
-            "component": component,
-            "timestamp": datetime.now().isoformat(),
-            **metadata_dict
-        }
+        getattr(system_logger, _LOG_METHODS.get(severity.lower(), "info"))(
+            message,
+            event_type=event_type,
+            component=component,
+            meta=metadata_dict
+        )
         
-        if severity.lower() == "warning":
-            system_logger.warning(message, **event_data)
-        elif severity.lower() == "error":
-            system_logger.error(message, **event_data)
-        elif severity.lower() == "critical":
-            system_logger.critical(message, **event_data)
-        else:
-            system_logger.info(message, **event_data)
-        
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"System event logged: {event_type}",
             "severity": severity,
@@ -216,7 +261,7 @@ async def log_system_event(
         
     except Exception as e:
         print(f"Critical logging failure: {e}")  # Fallback to print
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to log system event: {str(e)}"
         })
@@ -229,8 +274,7 @@ async def get_recent_logs(
     limit: int = 100
 ) -> str:
     """
-    Retrieve recent logs (Note: This is a simple implementation)
-    In production, you'd want to integrate with a proper log management system
+    Retrieve recent logs from the in-memory buffer, newest first
     
     Args:
         agent_id: Filter by agent ID
@@ -239,30 +283,38 @@ async def get_recent_logs(
         limit: Maximum number of logs to return
     """
     try:
-        # This is a simplified implementation
-        # In production, integrate with proper log aggregation system
+        level = level.lower()
+        logs = []
+        
+        # Snapshot first: other threads may append while we filter
+        for name, levelname, message in reversed(list(recent_log_handler.records)):
+            if level and levelname != level:
+                continue
+            
+            entry = _parse_log_record(name, levelname, message)
+            if agent_id and entry.get("agent_id") != agent_id:
+                continue
+            if activity_type and entry.get("activity_type") != activity_type:
+                continue
+            
+            logs.append(entry)
+            if len(logs) >= limit:
+                break
         
-        logs_info = {
-            "message": "Recent logs retrieval",
-            "note": "This is a simplified implementation. Integrate with log aggregation system for production use.",
+        return _dumps({
+            "success": True,
+            "logs": logs,
+            "count": len(logs),
             "filters": {
                 "agent_id": agent_id or "all",
                 "activity_type": activity_type or "all", 
                 "level": level or "all",
                 "limit": limit
-            },
-            "log_files": [
-                f"{log_dir}/ceo_agent_system.log"
-            ]
-        }
-        
-        return json.dumps({
-            "success": True,
-            "logs_info": logs_info
+            }
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to retrieve logs: {str(e)}"
         })
@@ -0,0 +1,85 @@
+import asyncio
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson
+from aiohttp import web
+
+from tools.mcp_tools import MCPToolManager
+
+
+async def _start_server(batch_reply):
+    """Fake MCP server; batch_reply(batch) decides how a batch POST is answered"""
+    calls = []
+
+    async def health(request):
+        return web.json_response({'status': 'healthy'})
+
+    async def mcp(request):
+        payload = orjson.loads(await request.read())
+        if isinstance(payload, list):
+            calls.append(('batch', [item['params']['name'] for item in payload]))
+            return batch_reply(payload)
+        calls.append(('single', payload['params']['name']))
+        return web.json_response({'jsonrpc': '2.0', 'id': payload['id'],
+                                  'result': {'tool': payload['params']['name']}})
+
+    app = web.Application()
+    app.router.add_get('/health', health)
+    app.router.add_post('/mcp', mcp)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}", calls
+
+
+async def _run_bulk(batch_reply):
+    runner, url, calls = await _start_server(batch_reply)
+    manager = MCPToolManager({'mcp_database_url': url})
+    try:
+        await manager._connect_to_server('database', manager.servers['database'])
+        results = await manager.execute_tools_bulk([
+            {'server_id': 'database', 'tool_name': 'query_database', 'parameters': {'query': 'a'}},
+            {'server_id': 'database', 'tool_name': 'execute_sql', 'parameters': {'query': 'b'}},
+        ])
+        return manager, results, calls
+    finally:
+        await manager.close()
+        await runner.cleanup()
+
+
+def test_batch_fallback_on_non_array_reply():
+    """A 200 reply that is not a JSON array disables batching and retries singly"""
+    def reply(batch):
+        return web.json_response({'jsonrpc': '2.0', 'id': None,
+                                  'error': {'code': -32600, 'message': 'Invalid Request'}})
+
+    manager, results, calls = asyncio.run(_run_bulk(reply))
+
+    assert manager.connections['database'].supports_batch is False
+    assert [result['success'] for result in results] == [True, True]
+    assert [result['tool_name'] for result in results] == ['query_database', 'execute_sql']
+    assert calls[0] == ('batch', ['query_database', 'execute_sql'])
+    assert sorted(calls[1:]) == [('single', 'execute_sql'), ('single', 'query_database')]
+
+
+def test_batch_server_error_is_not_replayed():
+    """A failed batch returns error results without replaying the calls"""
+    def reply(batch):
+        return web.Response(status=503, text='unavailable')
+
+    manager, results, calls = asyncio.run(_run_bulk(reply))
+
+    assert manager.connections['database'].supports_batch is True
+    assert [result['success'] for result in results] == [False, False]
+    assert all(result['status'] == 503 for result in results)
+    assert calls == [('batch', ['query_database', 'execute_sql'])]
+
+
+if __name__ == "__main__":
+    test_batch_fallback_on_non_array_reply()
+    test_batch_server_error_is_not_replayed()
+    print("✅ MCP batch tests passed")
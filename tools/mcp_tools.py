@@ -1,204 +1,825 @@
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
-import json
+from typing import Dict, List, Any, Optional, Mapping, Tuple
+from dataclasses import dataclass
+import time
+import itertools
+import collections
 import aiohttp
-from datetime import datetime
+import httpx
+import orjson
+from types import MappingProxyType
+from datetime import datetime, timezone
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Most bytes read from an error response before the connection is released
+_ERROR_BODY_LIMIT = 4096
+
+# Tool responses up to this size are read in one call; larger or unsized
+# bodies are streamed in chunks of _STREAM_CHUNK_SIZE
+_STREAM_THRESHOLD = 256 * 1024
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO string"""
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat()
+
+
+def _iso_from_monotonic(mono: float) -> str:
+    """Convert a time.monotonic() reading to a UTC ISO string"""
+    return datetime.fromtimestamp(time.time() - (time.monotonic() - mono),
+                                  tz=timezone.utc).isoformat()
+
+
+@dataclass(slots=True)
+class ServerConfig:
+    """Static configuration of one MCP server"""
+    url: str
+    name: str
+    tools: Tuple[str, ...]
+
+
+@dataclass(slots=True)
+class Conn:
+    """Live connection state of one MCP server"""
+    url: str
+    status: str
+    tools: Tuple[str, ...]
+    last_check: float
+    error: Optional[str] = None
+    # Whether tool calls should try the HTTP/2 client (https servers only)
+    http2: bool = False
+    # Cleared once the server rejects a JSON-RPC batch
+    supports_batch: bool = True
+
+
+class MCPError(Exception):
+    """Error response from an MCP server"""
+    
+    def __init__(self, message: str, status: Optional[int] = None,
+                 server_id: Optional[str] = None, tool_name: Optional[str] = None,
+                 body: bytes = b''):
+        super().__init__(message)
+        self.status = status
+        self.server_id = server_id
+        self.tool_name = tool_name
+        self.body = body
+
 
 class MCPToolManager:
     """Manager for MCP tool connections and execution"""
     
-    def __init__(self, config: Dict[str, Any]):
+    # Shared timeouts for tool calls and health probes
+    _EXEC_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5)
+    _HEALTH_TIMEOUT = aiohttp.ClientTimeout(total=5, connect=2)
+    
+    def __init__(self, config: Dict[str, Any],
+                 connector: Optional[aiohttp.BaseConnector] = None):
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.connections = {}
+        self.connections: Dict[str, Conn] = {}
         self.tools_cache = {}
         
+        # get_available_tools result, rebuilt only after a connection status change
+        self._available_tools_cache: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
+        self._available_tools_dirty = True
+        
+        # Cheap, monotonically increasing JSON-RPC request ids
+        self._next_id = itertools.count().__next__
+        
+        # Pre-serialized tools/call request prefixes per (server_id, tool_name)
+        self._request_templates: Dict[tuple, tuple] = {}
+        
+        # Shared HTTP session so every MCP call reuses pooled keep-alive connections
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # A host application may inject its own connector; it stays open when
+        # this manager closes (connector_owner=False)
+        self._connector = connector
+        
+        # Optional HTTP/2 transport for https MCP servers: concurrent tool calls
+        # share one multiplexed connection. HTTP/2 is only negotiated over TLS,
+        # so plain http URLs always use the aiohttp session.
+        self.http2 = config.get('mcp_http2', False)
+        self._http2_client: Optional[httpx.AsyncClient] = None
+        
+        # Connection pool sizing; a generous per-host limit keeps concurrent calls
+        # to one busy server (e.g. database) from queuing behind each other
+        self.pool_limit = config.get('mcp_pool_limit', 200)
+        self.pool_limit_per_host = config.get('mcp_pool_limit_per_host', 50)
+        
+        # Per-server circuit breakers: after breaker_threshold consecutive failures,
+        # calls fail fast for breaker_cooldown seconds before one is let through
+        self.breaker_threshold = config.get('mcp_breaker_threshold', 5)
+        self.breaker_cooldown = config.get('mcp_breaker_cooldown', 30)
+        self._breakers: Dict[str, Dict[str, Any]] = {}
+        
+        # Upper bound on a streamed tool response body
+        self.max_response_bytes = config.get('mcp_max_response_bytes', 64 * 1024 * 1024)
+        
+        # health_check results are reused for this many seconds; concurrent
+        # callers wait on a single in-flight probe instead of starting their own
+        self._health_ttl = config.get('mcp_health_ttl', 30)
+        self._health_cache: Optional[Dict[str, Any]] = None
+        self._health_cache_ts = 0.0
+        self._health_lock = asyncio.Lock()
+        
+        # Background task that re-probes every server each ping_interval seconds,
+        # keeping pooled connections warm and the health snapshot current
+        self.ping_interval = config.get('mcp_ping_interval', 15)
+        self._pinger_task: Optional[asyncio.Task] = None
+        
+        # Result cache for idempotent tools, keyed by (server_id, tool_name, params)
+        self._tool_ttls = {
+            'get_weather': 60,
+            'get_forecast': 300,
+            'get_schema': 600,
+            **config.get('mcp_tool_ttls', {})
+        }
+        # Write tools and the cached tools whose results they make stale
+        self._tool_invalidates = {
+            'execute_sql': ('get_schema',)
+        }
+        # Bounded LRU: least recently used entries are evicted past the size limit
+        self.result_cache_size = config.get('mcp_result_cache_size', 1024)
+        self._result_cache: 'collections.OrderedDict[tuple, tuple]' = collections.OrderedDict()
+        
+        # Read-only tools whose identical concurrent calls share one request
+        # (single-flight); cached tools are always coalesced
+        self._coalesced_tools = frozenset({
+            'get_schema', 'query_logs', 'get_log_stats', 'list_events',
+            'get_weather', 'get_forecast', 'get_weather_alerts', 'get_company_data'
+        })
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        
         # MCP server configurations
-        self.servers = {
-            'database': {
-                'url': config.get('mcp_database_url', 'http://localhost:8001'),
-                'name': 'Database MCP Server',
-                'tools': ['query_database', 'execute_sql', 'get_schema']
-            },
-            'logging': {
-                'url': config.get('mcp_logging_url', 'http://localhost:8002'), 
-                'name': 'Logging MCP Server',
-                'tools': ['log_event', 'query_logs', 'get_log_stats']
-            },
-            'calendar': {
-                'url': config.get('mcp_calendar_url', 'http://localhost:8003'),
-                'name': 'Calendar MCP Server', 
-                'tools': ['create_event', 'list_events', 'update_event', 'delete_event']
-            },
-            'weather': {
-                'url': config.get('mcp_weather_url', 'http://localhost:8004'),
-                'name': 'Weather MCP Server',
-                'tools': ['get_weather', 'get_forecast', 'get_weather_alerts']
-            },
-            'netcoro': {
-                'url': config.get('mcp_netcoro_url', 'http://localhost:8005'),
-                'name': 'NetcoRo Business MCP Server',
-                'tools': ['get_company_data', 'update_metrics', 'generate_report']
-            }
+        self.servers: Dict[str, ServerConfig] = {
+            'database': ServerConfig(
+                url=config.get('mcp_database_url', 'http://localhost:8001'),
+                name='Database MCP Server',
+                tools=('query_database', 'execute_sql', 'get_schema')
+            ),
+            'logging': ServerConfig(
+                url=config.get('mcp_logging_url', 'http://localhost:8002'),
+                name='Logging MCP Server',
+                tools=('log_event', 'query_logs', 'get_log_stats')
+            ),
+            'calendar': ServerConfig(
+                url=config.get('mcp_calendar_url', 'http://localhost:8003'),
+                name='Calendar MCP Server',
+                tools=('create_event', 'list_events', 'update_event', 'delete_event')
+            ),
+            'weather': ServerConfig(
+                url=config.get('mcp_weather_url', 'http://localhost:8004'),
+                name='Weather MCP Server',
+                tools=('get_weather', 'get_forecast', 'get_weather_alerts')
+            ),
+            'netcoro': ServerConfig(
+                url=config.get('mcp_netcoro_url', 'http://localhost:8005'),
+                name='NetcoRo Business MCP Server',
+                tools=('get_company_data', 'update_metrics', 'generate_report')
+            )
         }
     
+    async def __aenter__(self):
+        await self.initialize_connections()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            if self._connector is not None:
+                connector = self._connector
+            else:
+                connector = aiohttp.TCPConnector(
+                    limit=self.pool_limit,
+                    limit_per_host=self.pool_limit_per_host,
+                    keepalive_timeout=60,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True
+                )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                connector_owner=self._connector is None,
+                timeout=self._EXEC_TIMEOUT
+            )
+        return self._session
+    
+    def _get_http2_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP/2 client, creating it on first use"""
+        if self._http2_client is None or self._http2_client.is_closed:
+            self._http2_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+                timeout=30.0
+            )
+        return self._http2_client
+    
+    async def close(self):
+        """Stop the background pinger and close the shared HTTP clients"""
+        if self._pinger_task is not None:
+            self._pinger_task.cancel()
+            try:
+                await self._pinger_task
+            except asyncio.CancelledError:
+                pass
+            self._pinger_task = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._http2_client is not None:
+            await self._http2_client.aclose()
+            self._http2_client = None
+    
     async def initialize_connections(self):
         """Initialize connections to all MCP servers"""
         self.logger.info("Initializing MCP connections...")
+        self._get_session()
+        
+        # Connect to every server concurrently
+        results = await asyncio.gather(
+            *[self._connect_to_server(server_id, server_config)
+              for server_id, server_config in self.servers.items()],
+            return_exceptions=True
+        )
         
-        for server_id, server_config in self.servers.items():
+        for (server_id, server_config), result in zip(self.servers.items(), results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to connect to {server_id}: {str(result)}")
+            else:
+                self.logger.info(f"Connected to {server_config.name}")
+        
+        if self._pinger_task is None or self._pinger_task.done():
+            self._pinger_task = asyncio.create_task(self._pinger())
+    
+    async def _pinger(self):
+        """Periodically probe all servers and publish a fresh health snapshot"""
+        while True:
+            await asyncio.sleep(self.ping_interval)
             try:
-                await self._connect_to_server(server_id, server_config)
-                self.logger.info(f"Connected to {server_config['name']}")
+                self._health_cache = await self._check_health()
+                self._health_cache_ts = time.monotonic()
             except Exception as e:
-                self.logger.error(f"Failed to connect to {server_id}: {str(e)}")
+                self.logger.error(f"Background health probe failed: {str(e)}")
     
-    async def _connect_to_server(self, server_id: str, server_config: Dict[str, Any]):
+    async def _connect_to_server(self, server_id: str, server_config: ServerConfig):
         """Connect to individual MCP server"""
-        url = server_config['url']
+        url = server_config.url
         
         # Test connection
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(f"{url}/health") as response:
-                    if response.status == 200:
-                        self.connections[server_id] = {
-                            'url': url,
-                            'status': 'connected',
-                            'last_check': datetime.now(),
-                            'tools': server_config['tools']
-                        }
-                    else:
-                        raise Exception(f"Server returned status {response.status}")
-            except Exception as e:
-                self.connections[server_id] = {
-                    'url': url,
-                    'status': 'disconnected',
-                    'error': str(e),
-                    'last_check': datetime.now()
-                }
-                raise
+        session = self._get_session()
+        try:
+            async with session.get(f"{url}/health", timeout=self._HEALTH_TIMEOUT) as response:
+                # Drain the body so the keep-alive socket goes straight back to the pool
+                await response.read()
+                if response.status == 200:
+                    for tool_name in server_config.tools:
+                        self._request_template(server_id, tool_name)
+                    self.connections[server_id] = Conn(
+                        url=url,
+                        status='connected',
+                        tools=server_config.tools,
+                        last_check=time.monotonic(),
+                        http2=url.startswith('https://')
+                    )
+                    self._available_tools_dirty = True
+                else:
+                    raise MCPError(f"Server returned status {response.status}",
+                                   status=response.status, server_id=server_id)
+        except Exception as e:
+            self.connections[server_id] = Conn(
+                url=url,
+                status='disconnected',
+                tools=(),
+                last_check=time.monotonic(),
+                error=str(e),
+                http2=url.startswith('https://')
+            )
+            self._available_tools_dirty = True
+            raise
+    
+    def _request_template(self, server_id: str, tool_name: str) -> tuple:
+        """Return the (head, id prefix) byte fragments of a tools/call request"""
+        template = self._request_templates.get((server_id, tool_name))
+        if template is None:
+            head = (b'{"jsonrpc":"2.0","method":"tools/call","params":{"name":' +
+                    orjson.dumps(tool_name) + b',"arguments":')
+            # Opening quote of the id string, left unterminated for the counter
+            id_prefix = b'},"id":' + orjson.dumps(f"{server_id}_{tool_name}_")[:-1]
+            template = self._request_templates[(server_id, tool_name)] = (head, id_prefix)
+        return template
+    
+    def _build_request(self, server_id: str, tool_name: str,
+                       parameters: Dict[str, Any]) -> bytes:
+        """Serialize a tools/call request by patching arguments and id into its template"""
+        head, id_prefix = self._request_template(server_id, tool_name)
+        return (head + orjson.dumps(parameters) + id_prefix +
+                str(self._next_id()).encode() + b'"}')
+    
+    async def _read_json(self, response: aiohttp.ClientResponse) -> Any:
+        """Decode a JSON response body, streaming large payloads in bounded chunks"""
+        length = response.content_length
+        if length is not None and length <= _STREAM_THRESHOLD:
+            return orjson.loads(await response.read())
+        
+        # Large (e.g. query_database, generate_report) or chunked responses are
+        # streamed into one buffer so peak memory stays near the body size
+        if length is not None and length > self.max_response_bytes:
+            raise MCPError(f"Response of {length} bytes exceeds limit", status=response.status)
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+            body += chunk
+            if len(body) > self.max_response_bytes:
+                raise MCPError("Response exceeds size limit", status=response.status)
+        return orjson.loads(body)
+    
+    def invalidate(self, server_id: str, tool_name: Optional[str] = None):
+        """Drop cached results for a server, optionally only for one tool"""
+        for key in [key for key in self._result_cache
+                    if key[0] == server_id and (tool_name is None or key[1] == tool_name)]:
+            del self._result_cache[key]
+    
+    def _cached_result(self, key: tuple, ttl: float) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached result, dropping the entry if it has expired"""
+        cached = self._result_cache.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= ttl:
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return cached[1]
+    
+    def _cache_result(self, key: tuple, result: Dict[str, Any]):
+        """Store a result, evicting least recently used entries past the size limit"""
+        self._result_cache[key] = (time.monotonic(), result)
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
     
     async def execute_tool(self, server_id: str, tool_name: str, 
                           parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute tool on specific MCP server"""
+        """Execute tool on specific MCP server, serving idempotent tools from cache"""
+        ttl = self._tool_ttls.get(tool_name)
+        if not ttl and tool_name not in self._coalesced_tools:
+            result = await self._execute_tool(server_id, tool_name, parameters)
+            if result['success']:
+                for stale_tool in self._tool_invalidates.get(tool_name, ()):
+                    self.invalidate(server_id, stale_tool)
+            return result
+        
+        key = (server_id, tool_name, orjson.dumps(parameters, option=orjson.OPT_SORT_KEYS, default=str))
+        if ttl:
+            cached = self._cached_result(key, ttl)
+            if cached is not None:
+                return dict(cached)
+        
+        # Identical call already in flight: wait for its result instead
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # asyncio.wait neither cancels the shared future nor raises its outcome
+            await asyncio.wait((inflight,))
+            if not inflight.cancelled():
+                return dict(inflight.result())
+            # The leading caller was cancelled; make the call ourselves instead
+            return await self.execute_tool(server_id, tool_name, parameters)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._execute_tool(server_id, tool_name, parameters)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        
+        if ttl and result['success']:
+            self._cache_result(key, result)
+        future.set_result(result)
+        return dict(result)
+    
+    async def _execute_tool(self, server_id: str, tool_name: str,
+                            parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a single tools/call request to an MCP server"""
+        admission = self._breaker_admit(server_id)
+        if admission == 'open':
+            return self._circuit_open_result(server_id, tool_name)
+        
         try:
             if server_id not in self.connections:
                 raise ValueError(f"No connection to server: {server_id}")
             
             connection = self.connections[server_id]
-            if connection['status'] != 'connected':
+            if connection.status != 'connected':
                 raise ValueError(f"Server {server_id} is not connected")
             
-            # Prepare MCP request
-            mcp_request = {
-                "jsonrpc": "2.0",
-                "method": "tools/call",
-                "params": {
-                    "name": tool_name,
-                    "arguments": parameters
-                },
-                "id": f"{server_id}_{tool_name}_{datetime.now().timestamp()}"
-            }
+            # Execute request, over HTTP/2 where enabled and negotiated
+            payload = self._build_request(server_id, tool_name, parameters)
+            if self.http2 and connection.http2:
+                result = await self._post_http2(connection, server_id, tool_name, payload)
+            else:
+                result = await self._post_http1(connection, server_id, tool_name, payload)
             
-            # Execute request
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{connection['url']}/mcp",
-                    json=mcp_request,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        if 'error' in result:
-                            raise Exception(f"MCP Error: {result['error']}")
-                        
-                        return {
-                            'success': True,
-                            'result': result.get('result', {}),
-                            'server_id': server_id,
-                            'tool_name': tool_name,
-                            'timestamp': datetime.now().isoformat()
-                        }
-                    else:
-                        error_text = await response.text()
-                        raise Exception(f"HTTP {response.status}: {error_text}")
+            if 'error' in result:
+                raise MCPError(f"MCP Error: {result['error']}", status=200,
+                               server_id=server_id, tool_name=tool_name)
+            
+            self._breaker_record(server_id, None)
+            return {
+                'success': True,
+                'result': result.get('result', {}),
+                'server_id': server_id,
+                'tool_name': tool_name,
+                'timestamp': _iso_now()
+            }
             
         except Exception as e:
-            self.logger.error(f"Tool execution failed: {server_id}.{tool_name} - {str(e)}")
+            # Translate to an error result only at this boundary; the type is kept
+            # so callers can tell timeouts and connection errors from server errors
+            self.logger.error(f"Tool execution failed: {server_id}.{tool_name} - {e!r}")
+            
+            self._breaker_record(server_id, e)
+            status = getattr(e, 'status', None)
+            
             return {
                 'success': False,
                 'error': str(e),
+                'error_type': type(e).__name__,
+                'status': status,
                 'server_id': server_id,
                 'tool_name': tool_name,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _iso_now()
             }
+        
+        finally:
+            if admission == 'probe':
+                self._breaker_release_probe(server_id)
+    
+    def _breaker_admit(self, server_id: str) -> str:
+        """Decide whether a call may go to the server: 'closed', 'probe' or 'open'
+        
+        After the cooldown exactly one call is admitted as the half-open probe;
+        everything else keeps failing fast until that probe finishes.
+        """
+        breaker = self._breakers.get(server_id)
+        if not breaker or breaker['fails'] < self.breaker_threshold:
+            return 'closed'
+        if breaker['probing'] or time.monotonic() - breaker['opened_at'] < self.breaker_cooldown:
+            return 'open'
+        breaker['probing'] = True
+        return 'probe'
+    
+    def _breaker_record(self, server_id: str, error: Optional[Exception]):
+        """Update the server's breaker with the outcome of a call"""
+        if error is None:
+            self._breakers.pop(server_id, None)
+            return
+        
+        # Transport failures and 5xx count against the breaker; a server that
+        # answers with a tool-level error is alive, and unknown/disconnected
+        # servers never reached the network
+        if isinstance(error, ValueError):
+            return
+        status = getattr(error, 'status', None)
+        if status is None or status >= 500:
+            breaker = self._breakers.setdefault(
+                server_id, {'fails': 0, 'opened_at': 0.0, 'probing': False}
+            )
+            breaker['fails'] += 1
+            breaker['opened_at'] = time.monotonic()
+        else:
+            self._breakers.pop(server_id, None)
+    
+    def _breaker_release_probe(self, server_id: str):
+        """Clear the half-open probe flag however the probe call ended"""
+        breaker = self._breakers.get(server_id)
+        if breaker is not None:
+            breaker['probing'] = False
     
-    async def get_available_tools(self) -> Dict[str, List[str]]:
-        """Get list of available tools from all connected servers"""
-        available_tools = {}
+    def _circuit_open_result(self, server_id: str, tool_name: str) -> Dict[str, Any]:
+        """Error result for a call rejected by an open circuit breaker"""
+        return {
+            'success': False,
+            'error': 'circuit_open',
+            'error_type': 'CircuitOpen',
+            'status': None,
+            'server_id': server_id,
+            'tool_name': tool_name,
+            'timestamp': _iso_now()
+        }
+    
+    async def _post_http1(self, connection: Conn, server_id: str,
+                          tool_name: str, payload: bytes) -> Dict[str, Any]:
+        """POST a tools/call payload over the shared aiohttp session"""
+        async with self._get_session().post(
+            f"{connection.url}/mcp",
+            data=payload,
+            headers=_JSON_HEADERS,
+            timeout=self._EXEC_TIMEOUT
+        ) as response:
+            if response.status == 200:
+                return await self._read_json(response)
+            
+            # Bounded read so a huge error page is never buffered in full
+            body = await response.content.read(_ERROR_BODY_LIMIT)
+            response.release()
+            raise MCPError(f"HTTP {response.status}: {body.decode('utf-8', 'replace')}",
+                           status=response.status, server_id=server_id,
+                           tool_name=tool_name, body=body)
+    
+    async def _post_http2(self, connection: Conn, server_id: str,
+                          tool_name: str, payload: bytes) -> Dict[str, Any]:
+        """POST a tools/call payload over the multiplexed HTTP/2 client"""
+        response = await self._get_http2_client().post(
+            f"{connection.url}/mcp",
+            content=payload,
+            headers=_JSON_HEADERS
+        )
+        
+        # Servers that only speak HTTP/1.1 go back to the aiohttp pool from now on
+        if response.http_version != 'HTTP/2':
+            connection.http2 = False
+        
+        if response.status_code == 200:
+            return orjson.loads(response.content)
+        
+        body = response.content[:_ERROR_BODY_LIMIT]
+        raise MCPError(f"HTTP {response.status_code}: {body.decode('utf-8', 'replace')}",
+                       status=response.status_code, server_id=server_id,
+                       tool_name=tool_name, body=body)
+    
+    async def execute_tools_bulk(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Execute many tool calls, one JSON-RPC batch per server
+        
+        Each request is a dict with 'server_id', 'tool_name' and 'parameters'.
+        Results are returned in the same order as the requests.
+        """
+        buckets: Dict[str, List[int]] = {}
+        for index, request in enumerate(requests):
+            buckets.setdefault(request['server_id'], []).append(index)
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        
+        async def run_bucket(server_id: str, indexes: List[int]):
+            bucket_results = await self._execute_batch(
+                server_id, [requests[index] for index in indexes]
+            )
+            for index, result in zip(indexes, bucket_results):
+                results[index] = result
+        
+        # Dispatch per-server batches concurrently
+        await asyncio.gather(
+            *[run_bucket(server_id, indexes) for server_id, indexes in buckets.items()]
+        )
+        return results
+    
+    async def _execute_batch(self, server_id: str,
+                             requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send one server's requests as a JSON-RPC batch, falling back to single calls"""
+        connection = self.connections.get(server_id)
+        
+        # Batching support is detected on first use and remembered on the connection
+        if not (len(requests) > 1 and connection is not None and
+                connection.status == 'connected' and
+                connection.supports_batch):
+            return await self._execute_singly(server_id, requests)
+        
+        admission = self._breaker_admit(server_id)
+        if admission == 'open':
+            return [self._circuit_open_result(server_id, request['tool_name'])
+                    for request in requests]
+        
+        batch = [
+            {
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "params": {
+                    "name": request['tool_name'],
+                    "arguments": request.get('parameters', {})
+                },
+                "id": i
+            }
+            for i, request in enumerate(requests)
+        ]
+        
+        try:
+            async with self._get_session().post(
+                f"{connection.url}/mcp",
+                data=orjson.dumps(batch),
+                headers=_JSON_HEADERS,
+                timeout=self._EXEC_TIMEOUT
+            ) as response:
+                if response.status != 200:
+                    body = await response.content.read(_ERROR_BODY_LIMIT)
+                    response.release()
+                    raise MCPError(f"HTTP {response.status}: {body.decode('utf-8', 'replace')}",
+                                   status=response.status, server_id=server_id, body=body)
+                responses = await self._read_json(response)
+        except Exception as e:
+            # The server may have run some of the calls, so they are never replayed
+            self.logger.error(f"Batch request to {server_id} failed: {e!r}")
+            self._breaker_record(server_id, e)
+            timestamp = _iso_now()
+            return [
+                {
+                    'success': False,
+                    'error': str(e),
+                    'error_type': type(e).__name__,
+                    'status': getattr(e, 'status', None),
+                    'server_id': server_id,
+                    'tool_name': request['tool_name'],
+                    'timestamp': timestamp
+                }
+                for request in requests
+            ]
+        finally:
+            if admission == 'probe':
+                self._breaker_release_probe(server_id)
+        
+        # The server answered, so it is healthy whether or not it batches
+        self._breaker_record(server_id, None)
         
-        for server_id, connection in self.connections.items():
-            if connection['status'] == 'connected':
-                available_tools[server_id] = connection.get('tools', [])
+        # A well-formed reply that is not an array means batching is unsupported
+        # and none of the calls ran; only then is it safe to send them one by one
+        if not isinstance(responses, list):
+            connection.supports_batch = False
+            self.logger.info(f"{server_id} does not support batching, using single calls")
+            return await self._execute_singly(server_id, requests)
         
-        return available_tools
+        by_id = {item.get('id'): item for item in responses if isinstance(item, dict)}
+        timestamp = _iso_now()
+        results = []
+        for i, request in enumerate(requests):
+            item = by_id.get(i)
+            if item is None or 'error' in item:
+                error = item['error'] if item else 'missing response'
+                results.append({
+                    'success': False,
+                    'error': f"MCP Error: {error}",
+                    'error_type': 'MCPError',
+                    'status': 200,
+                    'server_id': server_id,
+                    'tool_name': request['tool_name'],
+                    'timestamp': timestamp
+                })
+            else:
+                for stale_tool in self._tool_invalidates.get(request['tool_name'], ()):
+                    self.invalidate(server_id, stale_tool)
+                results.append({
+                    'success': True,
+                    'result': item.get('result', {}),
+                    'server_id': server_id,
+                    'tool_name': request['tool_name'],
+                    'timestamp': timestamp
+                })
+        return results
+    
+    async def _execute_singly(self, server_id: str,
+                              requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run one server's requests as concurrent individual tool calls"""
+        return await asyncio.gather(
+            *[self.execute_tool(server_id, request['tool_name'], request.get('parameters', {}))
+              for request in requests]
+        )
+    
+    async def get_available_tools(self) -> Mapping[str, Tuple[str, ...]]:
+        """Get list of available tools from all connected servers (read-only view)"""
+        if self._available_tools_dirty:
+            available_tools = {}
+            
+            for server_id, connection in self.connections.items():
+                if connection.status == 'connected':
+                    available_tools[server_id] = connection.tools
+            
+            self._available_tools_cache = MappingProxyType(available_tools)
+            self._available_tools_dirty = False
+        
+        return self._available_tools_cache
+    
+    def _set_status(self, connection: Conn, status: str):
+        """Update a connection's status, marking the available-tools view stale on change"""
+        if connection.status != status:
+            connection.status = status
+            self._available_tools_dirty = True
+    
+    async def _probe(self, server_id: str, connection: Conn) -> Dict[str, Any]:
+        """Check one server's health endpoint and update its connection state"""
+        connection.last_check = time.monotonic()
+        try:
+            async with self._get_session().get(
+                f"{connection.url}/health",
+                timeout=self._HEALTH_TIMEOUT
+            ) as response:
+                await response.read()
+                if response.status == 200:
+                    self._set_status(connection, 'connected')
+                    # A healthy probe closes the server's circuit breaker
+                    self._breakers.pop(server_id, None)
+                else:
+                    self._set_status(connection, 'error')
+            
+            return {
+                'status': connection.status,
+                'url': connection.url,
+                'last_check': _iso_from_monotonic(connection.last_check)
+            }
+            
+        except Exception as e:
+            self._set_status(connection, 'disconnected')
+            connection.error = str(e)
+            return {
+                'status': 'disconnected',
+                'error': str(e),
+                'last_check': _iso_from_monotonic(connection.last_check)
+            }
+    
+    def _health_cache_fresh(self) -> bool:
+        if self._health_cache is None:
+            return False
+        # While the pinger runs its snapshot is always current enough
+        if self._pinger_task is not None and not self._pinger_task.done():
+            return True
+        return time.monotonic() - self._health_cache_ts < self._health_ttl
     
     async def health_check(self) -> Dict[str, Any]:
-        """Check health of all MCP connections"""
+        """Return the latest health snapshot, probing only if none is current"""
+        if self._health_cache_fresh():
+            return self._health_cache
+        
+        async with self._health_lock:
+            # Another caller may have refreshed the cache while we waited
+            if not self._health_cache_fresh():
+                self._health_cache = await self._check_health()
+                self._health_cache_ts = time.monotonic()
+            return self._health_cache
+    
+    async def _check_health(self) -> Dict[str, Any]:
+        """Probe all MCP connections"""
         health_status = {
             'overall_status': 'healthy',
             'servers': {},
             'total_servers': len(self.servers),
             'connected_servers': 0,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _iso_now()
         }
         
-        for server_id, connection in self.connections.items():
-            try:
-                # Test connection
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        f"{connection['url']}/health",
-                        timeout=aiohttp.ClientTimeout(total=5)
-                    ) as response:
-                        if response.status == 200:
-                            connection['status'] = 'connected'
-                            health_status['connected_servers'] += 1
-                        else:
-                            connection['status'] = 'error'
-                
-                health_status['servers'][server_id] = {
-                    'status': connection['status'],
-                    'url': connection['url'],
-                    'last_check': datetime.now().isoformat()
-                }
-                
-            except Exception as e:
-                connection['status'] = 'disconnected'
-                connection['error'] = str(e)
-                health_status['servers'][server_id] = {
-                    'status': 'disconnected',
-                    'error': str(e),
-                    'last_check': datetime.now().isoformat()
-                }
+        # Probe every server concurrently
+        server_ids = list(self.connections)
+        results = await asyncio.gather(
+            *[self._probe(server_id, self.connections[server_id]) for server_id in server_ids]
+        )
+        
+        for server_id, server_health in zip(server_ids, results):
+            health_status['servers'][server_id] = server_health
+            if server_health['status'] == 'connected':
+                health_status['connected_servers'] += 1
         
-        # Determine overall status
-        connected_ratio = health_status['connected_servers'] / health_status['total_servers']
-        if connected_ratio < 0.5:
+        # Determine overall status (integer form of the 50% / 100% connected thresholds)
+        connected = health_status['connected_servers']
+        total = health_status['total_servers']
+        if connected == total:
+            pass
+        elif 2 * connected < total:
             health_status['overall_status'] = 'critical'
-        elif connected_ratio < 1.0:
+        else:
             health_status['overall_status'] = 'degraded'
         
         return health_status
 
 
+_default_manager: Optional[MCPToolManager] = None
+_default_manager_lock = asyncio.Lock()
+
+
+async def get_default_mcp_manager(config: Dict[str, Any],
+                                  connector: Optional[aiohttp.BaseConnector] = None) -> MCPToolManager:
+    """Return the process-wide MCPToolManager, creating and connecting it on first call
+    
+    Later calls return the same instance and ignore their arguments, so the
+    whole app shares one connection pool.
+    """
+    global _default_manager
+    if _default_manager is None:
+        async with _default_manager_lock:
+            if _default_manager is None:
+                manager = MCPToolManager(config, connector=connector)
+                await manager.initialize_connections()
+                _default_manager = manager
+    return _default_manager
+
+
 # Specific tool managers for each domain
 class DatabaseManager:
-    """Database operations through MCP"""
+    """Database operations through MCP
+    
+    Always construct with the module-level manager from get_default_mcp_manager().
+    """
     
     def __init__(self, mcp_manager: MCPToolManager):
         self.mcp_manager = mcp_manager
@@ -225,7 +846,10 @@ class DatabaseManager:
 
 
 class CalendarManager:
-    """Calendar operations through MCP"""
+    """Calendar operations through MCP
+    
+    Always construct with the module-level manager from get_default_mcp_manager().
+    """
     
     def __init__(self, mcp_manager: MCPToolManager):
         self.mcp_manager = mcp_manager
@@ -252,7 +876,10 @@ class CalendarManager:
 
 
 class WeatherManager:
-    """Weather data through MCP"""
+    """Weather data through MCP
+    
+    Always construct with the module-level manager from get_default_mcp_manager().
+    """
     
     def __init__(self, mcp_manager: MCPToolManager):
         self.mcp_manager = mcp_manager
@@ -279,7 +906,10 @@ class WeatherManager:
 
 
 class NetcoRoToolManager:
-    """NetcoRo-specific business tools"""
+    """NetcoRo-specific business tools
+    
+    Always construct with the module-level manager from get_default_mcp_manager().
+    """
     
     def __init__(self, mcp_manager: MCPToolManager):
         self.mcp_manager = mcp_manager
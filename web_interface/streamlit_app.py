@@ -1,15 +1,217 @@
 import streamlit as st
 import asyncio
 import json
+import collections
+import sys
+import threading
+import time
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
-import plotly.express as px
 import plotly.graph_objects as go
 
 from ..ceo_client.agent_coordinator import AgentCoordinator, create_coordinator, TaskPriority
 from ..utils.config import get_config
 
+# libuv-backed event loop where available (uvloop does not support Windows)
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+else:
+    uvloop = None
+
+
+@st.cache_resource
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Event loop shared by every session and rerun, running on a daemon thread"""
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="netcoro-event-loop", daemon=True).start()
+    return loop
+
+
+def _submit(coro):
+    """Schedule a coroutine on the shared event loop and return its concurrent future"""
+    loop = get_event_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        # Blocking on the loop from its own thread would deadlock it
+        coro.close()
+        raise RuntimeError("Cannot block on the shared event loop from inside it; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop)
+
+
+def _await(coro):
+    """Run a coroutine on the shared event loop from a script thread and return its result"""
+    return _submit(coro).result()
+
+
+# Custom CSS for NetcoRo branding
+_CUSTOM_CSS = """
+<style>
+.main-header {
+    background: linear-gradient(90deg, #1e3a8a, #3b82f6);
+    color: white;
+    padding: 1rem;
+    border-radius: 10px;
+    text-align: center;
+    margin-bottom: 2rem;
+}
+
+.agent-card {
+    background: #f8fafc;
+    border: 1px solid #e2e8f0;
+    border-radius: 10px;
+    padding: 1rem;
+    margin: 0.5rem 0;
+}
+
+.status-active {
+    color: #10b981;
+    font-weight: bold;
+}
+
+.status-busy {
+    color: #f59e0b;
+    font-weight: bold;
+}
+
+.status-error {
+    color: #ef4444;
+    font-weight: bold;
+}
+
+.metric-card {
+    background: white;
+    border-radius: 8px;
+    padding: 1rem;
+    border-left: 4px solid #3b82f6;
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+}
+
+.chat-message {
+    background: #f1f5f9;
+    border-radius: 10px;
+    padding: 1rem;
+    margin: 0.5rem 0;
+    border-left: 4px solid #3b82f6;
+}
+
+.agent-response {
+    background: #ecfdf5;
+    border-radius: 10px;
+    padding: 1rem;
+    margin: 0.5rem 0;
+    border-left: 4px solid #10b981;
+}
+</style>
+"""
+
+_AGENTS = {
+    'ceo_agent': '👔 CEO - Strategic Leadership',
+    'cto_agent': '💻 CTO - Technology Strategy',
+    'cfo_agent': '💰 CFO - Financial Planning',
+    'hr_agent': '👥 HR - People Management',
+    'sales_agent': '📈 Sales - Revenue Growth',
+    'legal_agent': '⚖️ Legal - Compliance & Risk',
+    'ops_agent': '⚙️ Operations - Efficiency'
+}
+
+# Mock MCP status (replace with real data)
+_MCP_TOOLS = {
+    "Database MCP": {"status": "Connected", "url": "http://localhost:8001"},
+    "Calendar MCP": {"status": "Connected", "url": "http://localhost:8003"},
+    "Weather MCP": {"status": "Connected", "url": "http://localhost:8004"},
+    "Logging MCP": {"status": "Connected", "url": "http://localhost:8002"}
+}
+
+# Messages kept in a session's chat history, and how many of the newest are shown
+_CHAT_HISTORY_LIMIT = 200
+_CHAT_RENDER_LIMIT = 50
+
+_USER_MESSAGE_TEMPLATE = """
+<div class="chat-message">
+    <strong>You:</strong> {content}
+</div>
+"""
+
+_AGENT_MESSAGE_TEMPLATE = """
+<div class="agent-response">
+    <strong>{agent}:</strong> {content}
+</div>
+"""
+
+
+def _render_messages(messages) -> str:
+    """HTML for a sequence of chat messages"""
+    return "".join(
+        _USER_MESSAGE_TEMPLATE.format(content=message['content'])
+        if message['type'] == 'user' else
+        _AGENT_MESSAGE_TEMPLATE.format(agent=message['agent'], content=message['content'])
+        for message in messages
+    )
+
+
+# Most points sent to the browser per time-series trace
+_MAX_CHART_POINTS = 2000
+
+# How long a status snapshot is reused across reruns
+_STATUS_TTL_SECONDS = 5
+
+# Nominal duration used to fill the progress bar of a background quick action
+_QUICK_ACTION_EXPECTED_SECONDS = 60
+_QUICK_ACTION_POLL_INTERVAL = 0.2
+
+# Plotly config for st.plotly_chart; charts are sized by their container, so
+# Plotly's own resize handler only causes extra reflows
+_PLOT_CONFIG = {'responsive': False}
+
+_AGENT_CARD_TEMPLATE = """
+<div class="agent-card">
+    <h4>{name}</h4>
+    <p class="status-{status}">Status: {status_title}</p>
+    <p>Queue Size: {queue_size}</p>
+    <p>Current Task: {current_task}</p>
+</div>
+"""
+
+
+def _downsample(df: pd.DataFrame, max_points: int = _MAX_CHART_POINTS) -> pd.DataFrame:
+    """Evenly thin a time series to at most max_points rows, keeping the last row"""
+    if len(df) <= max_points:
+        return df
+    return df.iloc[np.unique(np.linspace(0, len(df) - 1, max_points).astype(np.int64))]
+
+
+async def _fetch_status(coordinator):
+    """Fetch system health and agent status concurrently"""
+    return await asyncio.gather(
+        coordinator.get_system_health(),
+        coordinator.get_agent_status()
+    )
+
+
+_STREAM_END = object()
+
+
+async def _anext(agen):
+    """Next item of an async generator, or _STREAM_END once it is exhausted"""
+    try:
+        return await agen.__anext__()
+    except StopAsyncIteration:
+        return _STREAM_END
+
+
+@st.cache_data(ttl=_STATUS_TTL_SECONDS, show_spinner=False)
+def _fetch_status_snapshot(coordinator_id: int, _coordinator) -> tuple:
+    """(system health, agent status) for a coordinator, reused across reruns for a few seconds"""
+    return tuple(_await(_fetch_status(_coordinator)))
+
 
 class StreamlitApp:
     """Streamlit web application for NetcoRo agents"""
@@ -31,72 +233,30 @@ class StreamlitApp:
     
     def load_custom_css(self):
         """Load custom CSS for NetcoRo branding"""
-        st.markdown("""
-        <style>
-        .main-header {
-            background: linear-gradient(90deg, #1e3a8a, #3b82f6);
-            color: white;
-            padding: 1rem;
-            border-radius: 10px;
-            text-align: center;
-            margin-bottom: 2rem;
-        }
-        
-        .agent-card {
-            background: #f8fafc;
-            border: 1px solid #e2e8f0;
-            border-radius: 10px;
-            padding: 1rem;
-            margin: 0.5rem 0;
-        }
-        
-        .status-active {
-            color: #10b981;
-            font-weight: bold;
-        }
-        
-        .status-busy {
-            color: #f59e0b;
-            font-weight: bold;
-        }
-        
-        .status-error {
-            color: #ef4444;
-            font-weight: bold;
-        }
-        
-        .metric-card {
-            background: white;
-            border-radius: 8px;
-            padding: 1rem;
-            border-left: 4px solid #3b82f6;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }
-        
-        .chat-message {
-            background: #f1f5f9;
-            border-radius: 10px;
-            padding: 1rem;
-            margin: 0.5rem 0;
-            border-left: 4px solid #3b82f6;
-        }
-        
-        .agent-response {
-            background: #ecfdf5;
-            border-radius: 10px;
-            padding: 1rem;
-            margin: 0.5rem 0;
-            border-left: 4px solid #10b981;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+    
+    def _run(self, coro):
+        """Run a coroutine on the shared event loop and return its result"""
+        return _await(coro)
     
-    async def initialize_coordinator(self):
-        """Initialize the agent coordinator"""
+    def _iter_async(self, agen):
+        """Iterate an async generator from the script thread, one item per loop round-trip"""
+        while True:
+            item = _await(_anext(agen))
+            if item is _STREAM_END:
+                return
+            yield item
+    
+    def initialize_coordinator(self):
+        """Initialize the agent coordinator, reusing the session's instance across reruns"""
+        if self.coordinator is None:
+            self.coordinator = st.session_state.get('coordinator')
+        
         if self.coordinator is None:
             try:
                 with st.spinner("Initializing NetcoRo AI Executive Team..."):
-                    self.coordinator = await create_coordinator(self.config)
+                    self.coordinator = self._run(create_coordinator(self.config))
+                st.session_state.coordinator = self.coordinator
                 st.success("✅ Agent system initialized successfully!")
                 return True
             except Exception as e:
@@ -116,7 +276,7 @@ class StreamlitApp:
         """, unsafe_allow_html=True)
         
         # Initialize coordinator
-        if not asyncio.run(self.initialize_coordinator()):
+        if not self.initialize_coordinator():
             st.stop()
         
         # Sidebar navigation
@@ -145,8 +305,7 @@ class StreamlitApp:
         st.header("Executive Dashboard")
         
         # Get system status
-        system_status = asyncio.run(self.coordinator.get_system_health())
-        agent_status = asyncio.run(self.coordinator.get_agent_status())
+        system_status, agent_status = _fetch_status_snapshot(id(self.coordinator), self.coordinator)
         
         # Metrics row
         col1, col2, col3, col4 = st.columns(4)
@@ -189,29 +348,19 @@ class StreamlitApp:
         col1, col2 = st.columns(2)
         
         with col1:
-            st.subheader("Agent Status")
-            agents_data = agent_status.get('agents', {})
-            
-            for agent_id, info in agents_data.items():
-                status_class = f"status-{info['status']}"
-                
-                st.markdown(f"""
-                <div class="agent-card">
-                    <h4>{agent_id.replace('_', ' ').title()}</h4>
-                    <p class="{status_class}">Status: {info['status'].title()}</p>
-                    <p>Queue Size: {info['task_queue_size']}</p>
-                    <p>Current Task: {info['current_task'] or 'None'}</p>
-                </div>
-                """, unsafe_allow_html=True)
+            self.agent_cards()
         
         with col2:
             st.subheader("Recent Activity")
             
             # Performance metrics
             coord_stats = agent_status.get('coordination_stats', {})
+            total_tasks = coord_stats.get('total_tasks', 0)
+            completed_tasks = coord_stats.get('completed_tasks', 0)
+            success_rate = completed_tasks / max(total_tasks, 1) * 100
             
-            st.metric("Total Tasks Processed", coord_stats.get('total_tasks', 0))
-            st.metric("Success Rate", f"{(coord_stats.get('completed_tasks', 0) / max(coord_stats.get('total_tasks', 1), 1) * 100):.1f}%")
+            st.metric("Total Tasks Processed", total_tasks)
+            st.metric("Success Rate", f"{success_rate:.1f}%")
             st.metric("Avg Response Time", f"{coord_stats.get('avg_completion_time', 0):.2f}s")
         
         # Quick actions
@@ -230,6 +379,26 @@ class StreamlitApp:
         with col3:
             if st.button("💡 Innovation Brainstorm", use_container_width=True):
                 self.quick_coordination("innovation_session")
+        
+        self.show_quick_action_progress()
+    
+    def agent_cards(self):
+        """Agent status cards from the shared status snapshot"""
+        st.subheader("Agent Status")
+        _, agent_status = _fetch_status_snapshot(id(self.coordinator), self.coordinator)
+        agents_data = agent_status.get('agents', {})
+        
+        # All cards in one markdown element instead of one per agent
+        st.markdown("".join(
+            _AGENT_CARD_TEMPLATE.format(
+                name=agent_id.replace('_', ' ').title(),
+                status=info['status'],
+                status_title=info['status'].title(),
+                queue_size=info['task_queue_size'],
+                current_task=info['current_task'] or 'None'
+            )
+            for agent_id, info in agents_data.items()
+        ), unsafe_allow_html=True)
     
     def chat_page(self):
         """Chat interface with agents"""
@@ -241,20 +410,10 @@ class StreamlitApp:
         with col1:
             st.subheader("Select Agent")
             
-            agents = {
-                'ceo_agent': '👔 CEO - Strategic Leadership',
-                'cto_agent': '💻 CTO - Technology Strategy', 
-                'cfo_agent': '💰 CFO - Financial Planning',
-                'hr_agent': '👥 HR - People Management',
-                'sales_agent': '📈 Sales - Revenue Growth',
-                'legal_agent': '⚖️ Legal - Compliance & Risk',
-                'ops_agent': '⚙️ Operations - Efficiency'
-            }
-            
             selected_agent = st.selectbox(
                 "Choose an agent:",
-                list(agents.keys()),
-                format_func=lambda x: agents[x]
+                list(_AGENTS),
+                format_func=_AGENTS.__getitem__
             )
             
             # Coordination option
@@ -263,8 +422,8 @@ class StreamlitApp:
             
             coordination_agents = st.multiselect(
                 "Select agents for collaboration:",
-                list(agents.keys()),
-                format_func=lambda x: agents[x]
+                list(_AGENTS),
+                format_func=_AGENTS.__getitem__
             )
             
             coordination_type = st.selectbox(
@@ -273,52 +432,48 @@ class StreamlitApp:
             )
         
         with col2:
-            st.subheader("Conversation")
-            
-            # Initialize chat history
-            if 'chat_history' not in st.session_state:
-                st.session_state.chat_history = []
-            
-            # Display chat history
-            chat_container = st.container()
-            with chat_container:
-                for message in st.session_state.chat_history:
-                    if message['type'] == 'user':
-                        st.markdown(f"""
-                        <div class="chat-message">
-                            <strong>You:</strong> {message['content']}
-                        </div>
-                        """, unsafe_allow_html=True)
-                    else:
-                        st.markdown(f"""
-                        <div class="agent-response">
-                            <strong>{message['agent']}:</strong> {message['content']}
-                        </div>
-                        """, unsafe_allow_html=True)
-            
-            # Chat input
-            user_input = st.text_area(
-                "Enter your message:",
-                height=100,
-                placeholder="Ask your agents anything about business strategy, operations, or decisions..."
-            )
-            
-            col1, col2, col3 = st.columns([1, 1, 2])
-            
-            with col1:
-                if st.button("Send to Agent", use_container_width=True):
-                    if user_input and selected_agent:
-                        self.process_agent_chat(selected_agent, user_input)
-            
-            with col2:
-                if st.button("Coordinate Agents", use_container_width=True):
-                    if user_input and coordination_agents:
-                        self.process_coordination_chat(coordination_agents, coordination_type, user_input)
-            
-            with col3:
-                if st.button("Clear Chat", use_container_width=True):
-                    st.session_state.chat_history = []
-                    st.experimental_rerun()
+            self.chat_conversation(selected_agent, coordination_agents, coordination_type)
+    
+    @st.fragment
+    def chat_conversation(self, selected_agent: str, coordination_agents: list, coordination_type: str):
+        """Chat history and input; sending a message reruns only this fragment"""
+        st.subheader("Conversation")
+        
+        # Initialize chat history
+        if 'chat_history' not in st.session_state:
+            st.session_state.chat_history = collections.deque(maxlen=_CHAT_HISTORY_LIMIT)
+        
+        # Display the most recent messages as a single markdown element
+        chat_container = st.container()
+        with chat_container:
+            recent = list(st.session_state.chat_history)[-_CHAT_RENDER_LIMIT:]
+            if recent:
+                st.markdown(_render_messages(recent), unsafe_allow_html=True)
+        
+        # Chat input
+        user_input = st.text_area(
+            "Enter your message:",
+            height=100,
+            placeholder="Ask your agents anything about business strategy, operations, or decisions..."
+        )
+        
+        col1, col2, col3 = st.columns([1, 1, 2])
+        
+        with col1:
+            if st.button("Send to Agent", use_container_width=True):
+                if user_input and selected_agent:
+                    self.process_agent_chat(selected_agent, user_input, chat_container)
+        
+        with col2:
+            if st.button("Coordinate Agents", use_container_width=True):
+                if user_input and coordination_agents:
+                    self.process_coordination_chat(coordination_agents, coordination_type, user_input,
+                                                   chat_container)
+        
+        with col3:
+            if st.button("Clear Chat", use_container_width=True):
+                st.session_state.chat_history.clear()
+                st.rerun(scope="fragment")
     
     def status_page(self):
         """System status and health monitoring"""
@@ -326,21 +481,22 @@ class StreamlitApp:
         
         # Real-time status
         if st.button("🔄 Refresh Status"):
-            st.experimental_rerun()
+            _fetch_status_snapshot.clear()
+            st.rerun()
         
         # Get detailed status
-        system_health = asyncio.run(self.coordinator.get_system_health())
-        agent_status = asyncio.run(self.coordinator.get_agent_status())
+        system_health, agent_status = _fetch_status_snapshot(id(self.coordinator), self.coordinator)
         
         # Overall health indicator
         health_status = system_health.get('coordinator_status', 'unknown')
+        health_title = health_status.title()
         
         if health_status == 'healthy':
-            st.success(f"✅ System Status: {health_status.title()}")
+            st.success(f"✅ System Status: {health_title}")
         elif health_status == 'degraded':
-            st.warning(f"⚠️ System Status: {health_status.title()}")
+            st.warning(f"⚠️ System Status: {health_title}")
         else:
-            st.error(f"❌ System Status: {health_status.title()}")
+            st.error(f"❌ System Status: {health_title}")
         
         # Detailed agent status
         col1, col2 = st.columns(2)
@@ -365,33 +521,57 @@ class StreamlitApp:
             coord_stats = agent_status.get('coordination_stats', {})
             
             # Create performance chart
-            if coord_stats.get('agent_utilization'):
-                utilization_data = []
-                for agent_id, stats in coord_stats['agent_utilization'].items():
-                    utilization_data.append({
-                        'Agent': agent_id.replace('_', ' ').title(),
-                        'Tasks Completed': stats.get('tasks_completed', 0),
-                        'Success Rate': stats.get('success_rate', 0) * 100,
-                        'Avg Time (s)': stats.get('avg_completion_time', 0)
-                    })
+            utilization = coord_stats.get('agent_utilization')
+            if utilization:
+                count = len(utilization)
                 
-                df = pd.DataFrame(utilization_data)
+                # Build each column in one pass (percentages in one vectorized
+                # multiply) and the frame in one call
+                df = pd.DataFrame({
+                    'Agent': [agent_id.replace('_', ' ').title() for agent_id in utilization],
+                    'Tasks Completed': np.fromiter(
+                        (stats.get('tasks_completed', 0) for stats in utilization.values()),
+                        dtype=np.int64, count=count),
+                    'Success Rate': np.fromiter(
+                        (stats.get('success_rate', 0) for stats in utilization.values()),
+                        dtype=np.float32, count=count) * 100,
+                    'Avg Time (s)': np.fromiter(
+                        (stats.get('avg_completion_time', 0) for stats in utilization.values()),
+                        dtype=np.float32, count=count)
+                })
                 
                 if not df.empty:
                     # Success rate chart
-                    fig_success = px.bar(
-                        df, 
-                        x='Agent', 
-                        y='Success Rate',
+                    fig_success = go.Figure(go.Bar(
+                        x=df['Agent'].values,
+                        y=df['Success Rate'].values,
+                        marker=dict(
+                            color=df['Success Rate'].values,
+                            colorscale='RdYlGn',
+                            showscale=True
+                        )
+                    ))
+                    fig_success.update_layout(
                         title='Agent Success Rates',
-                        color='Success Rate',
-                        color_continuous_scale='RdYlGn'
+                        xaxis_title='Agent',
+                        yaxis_title='Success Rate',
+                        uirevision='constant'
                     )
-                    st.plotly_chart(fig_success, use_container_width=True)
+                    st.plotly_chart(fig_success, use_container_width=True, config=_PLOT_CONFIG)
                     
                     # Performance metrics table
                     st.subheader("Detailed Metrics")
-                    st.dataframe(df, use_container_width=True)
+                    st.dataframe(
+                        df,
+                        use_container_width=True,
+                        hide_index=True,
+                        column_config={
+                            'Success Rate': st.column_config.ProgressColumn(
+                                'Success Rate', format='%.1f%%', min_value=0, max_value=100
+                            ),
+                            'Avg Time (s)': st.column_config.NumberColumn('Avg Time (s)', format='%.2f')
+                        }
+                    )
         
         # Memory and system info
         st.subheader("System Resources")
@@ -464,15 +644,7 @@ class StreamlitApp:
         # MCP Tools section
         st.subheader("MCP Tools Status")
         
-        # Mock MCP status (replace with real data)
-        mcp_tools = {
-            "Database MCP": {"status": "Connected", "url": "http://localhost:8001"},
-            "Calendar MCP": {"status": "Connected", "url": "http://localhost:8003"},
-            "Weather MCP": {"status": "Connected", "url": "http://localhost:8004"},
-            "Logging MCP": {"status": "Connected", "url": "http://localhost:8002"}
-        }
-        
-        for tool_name, info in mcp_tools.items():
+        for tool_name, info in _MCP_TOOLS.items():
             col1, col2, col3 = st.columns([2, 1, 1])
             
             with col1:
@@ -508,44 +680,67 @@ class StreamlitApp:
             if st.button("📊 Export Logs", use_container_width=True):
                 st.success("Logs exported!")
     
-    def process_agent_chat(self, agent_id: str, message: str):
-        """Process single agent chat"""
+    def _show_new_messages(self, container, messages: list):
+        """Append just the new messages to the rendered chat instead of re-sending the history"""
+        if messages:
+            with container:
+                st.markdown(_render_messages(messages), unsafe_allow_html=True)
+    
+    def process_agent_chat(self, agent_id: str, message: str, container):
+        """Process single agent chat, streaming the reply when the agent supports it"""
         try:
             # Add user message to history
-            st.session_state.chat_history.append({
+            user_message = {
                 'type': 'user',
                 'content': message,
                 'timestamp': datetime.now()
-            })
+            }
+            st.session_state.chat_history.append(user_message)
+            new_messages = [user_message]
             
-            with st.spinner(f"Processing request with {agent_id}..."):
-                # Get agent response (mock for now)
-                agent = self.coordinator.agents.get(agent_id)
-                if agent:
-                    response = asyncio.run(agent.process_query(message))
-                    
-                    # Add agent response to history
-                    st.session_state.chat_history.append({
-                        'type': 'agent',
-                        'agent': agent_id.replace('_', ' ').title(),
-                        'content': response,
-                        'timestamp': datetime.now()
-                    })
+            # Get agent response (mock for now)
+            agent = self.coordinator.agents.get(agent_id)
+            if agent:
+                agent_name = agent_id.replace('_', ' ').title()
+                stream_query = getattr(agent, 'stream_query', None)
+                
+                if stream_query is not None:
+                    # Show the reply chunk by chunk instead of behind a spinner
+                    with container:
+                        st.markdown(_render_messages(new_messages), unsafe_allow_html=True)
+                        st.markdown(f"**{agent_name}:**")
+                        response = st.write_stream(self._iter_async(stream_query(message)))
+                    new_messages = []
+                else:
+                    with st.spinner(f"Processing request with {agent_id}..."):
+                        response = self._run(agent.process_query(message))
+                
+                # Add agent response to history
+                agent_message = {
+                    'type': 'agent',
+                    'agent': agent_name,
+                    'content': response,
+                    'timestamp': datetime.now()
+                }
+                st.session_state.chat_history.append(agent_message)
+                if new_messages:
+                    new_messages.append(agent_message)
             
-            st.experimental_rerun()
+            self._show_new_messages(container, new_messages)
             
         except Exception as e:
             st.error(f"Error processing chat: {str(e)}")
     
-    def process_coordination_chat(self, agents: list, coord_type: str, message: str):
+    def process_coordination_chat(self, agents: list, coord_type: str, message: str, container):
         """Process multi-agent coordination"""
         try:
             # Add user message to history
-            st.session_state.chat_history.append({
+            user_message = {
                 'type': 'user',
                 'content': f"[Coordination with {len(agents)} agents] {message}",
                 'timestamp': datetime.now()
-            })
+            }
+            st.session_state.chat_history.append(user_message)
             
             with st.spinner(f"Coordinating {len(agents)} agents..."):
                 coordination_request = {
@@ -555,7 +750,7 @@ class StreamlitApp:
                     'context': {}
                 }
                 
-                result = asyncio.run(self.coordinator.coordinate_agents(coordination_request))
+                result = self._run(self.coordinator.coordinate_agents(coordination_request))
                 
                 if result['success']:
                     response = f"Coordination completed successfully!\n\nResult: {result['result']}"
@@ -563,14 +758,15 @@ class StreamlitApp:
                     response = f"Coordination failed: {result['error']}"
                 
                 # Add coordination response to history
-                st.session_state.chat_history.append({
+                agent_message = {
                     'type': 'agent',
                     'agent': f"Team Coordination ({coord_type})",
                     'content': response,
                     'timestamp': datetime.now()
-                })
+                }
+                st.session_state.chat_history.append(agent_message)
             
-            st.experimental_rerun()
+            self._show_new_messages(container, [user_message, agent_message])
             
         except Exception as e:
             st.error(f"Error in coordination: {str(e)}")
@@ -593,49 +789,106 @@ class StreamlitApp:
                 }
             }
             
-            if action_type in actions:
+            if action_type in actions and 'quick_action' not in st.session_state:
                 action = actions[action_type]
                 
-                with st.spinner(f"Executing {action_type.replace('_', ' ')}..."):
-                    result = asyncio.run(self.coordinator.coordinate_agents({
-                        'type': 'collaborative',
-                        'agents': action['agents'],
-                        'objective': action['objective']
-                    }))
-                    
-                    if result['success']:
-                        st.success(f"✅ {action_type.replace('_', ' ').title()} completed!")
-                        with st.expander("View Results"):
-                            st.json(result['result'])
-                    else:
-                        st.error(f"❌ Failed: {result['error']}")
+                # Run in the background on the shared loop; progress is polled on rerun
+                future = _submit(self.coordinator.coordinate_agents({
+                    'type': 'collaborative',
+                    'agents': action['agents'],
+                    'objective': action['objective']
+                }))
+                st.session_state.quick_action = (action_type, future, time.monotonic())
+        
+        except Exception as e:
+            st.error(f"Action failed: {str(e)}")
+    
+    def show_quick_action_progress(self):
+        """Show progress of a background quick action, or its result once done"""
+        quick_action = st.session_state.get('quick_action')
+        if quick_action is not None:
+            action_type, future, _ = quick_action
+            if not future.done():
+                self._poll_quick_action()
+                return
+            del st.session_state.quick_action
+            st.session_state.quick_action_result = (action_type, future)
+        
+        if 'quick_action_result' not in st.session_state:
+            return
+        
+        action_type, future = st.session_state.pop('quick_action_result')
+        
+        try:
+            result = future.result()
+            
+            if result['success']:
+                st.success(f"✅ {action_type.replace('_', ' ').title()} completed!")
+                with st.expander("View Results"):
+                    st.json(result['result'])
+            else:
+                st.error(f"❌ Failed: {result['error']}")
         
         except Exception as e:
             st.error(f"Action failed: {str(e)}")
     
+    @st.fragment(run_every=_QUICK_ACTION_POLL_INTERVAL)
+    def _poll_quick_action(self):
+        """Progress bar for a pending quick action; reruns the app once it finishes"""
+        quick_action = st.session_state.get('quick_action')
+        if quick_action is None:
+            return
+        
+        action_type, future, started = quick_action
+        if future.done():
+            # The result is shown outside this fragment, so the whole page reruns
+            del st.session_state.quick_action
+            st.session_state.quick_action_result = (action_type, future)
+            st.rerun()
+        
+        elapsed = time.monotonic() - started
+        st.progress(
+            min(elapsed / _QUICK_ACTION_EXPECTED_SECONDS, 0.95),
+            text=f"Executing {action_type.replace('_', ' ')}... ({elapsed:.0f}s)"
+        )
+    
     def show_analytics_charts(self, start_date, end_date):
         """Display analytics charts"""
         # Sample data (replace with real analytics)
         
         # Task completion over time
         dates = pd.date_range(start_date, end_date, freq='D')
+        i = np.arange(len(dates))
         task_data = pd.DataFrame({
             'Date': dates,
-            'Tasks Completed': [20 + i*2 + (i%3)*5 for i in range(len(dates))],
-            'Success Rate': [0.85 + (i%10)*0.01 for i in range(len(dates))]
+            'Tasks Completed': 20 + i*2 + (i%3)*5,
+            'Success Rate': 0.85 + (i%10)*0.01
         })
         
+        # Only a bounded number of points per trace is shipped to the browser
+        chart_data = _downsample(task_data)
+        
         col1, col2 = st.columns(2)
         
         with col1:
-            fig_tasks = px.line(task_data, x='Date', y='Tasks Completed', 
-                              title='Daily Task Completion')
-            st.plotly_chart(fig_tasks, use_container_width=True)
+            fig_tasks = go.Figure(go.Scattergl(
+                x=chart_data['Date'].values,
+                y=chart_data['Tasks Completed'].values,
+                mode='lines'
+            ))
+            fig_tasks.update_layout(title='Daily Task Completion', xaxis_title='Date',
+                                    yaxis_title='Tasks Completed', uirevision='constant')
+            st.plotly_chart(fig_tasks, use_container_width=True, config=_PLOT_CONFIG)
         
         with col2:
-            fig_success = px.line(task_data, x='Date', y='Success Rate',
-                                title='Success Rate Trend')
-            st.plotly_chart(fig_success, use_container_width=True)
+            fig_success = go.Figure(go.Scattergl(
+                x=chart_data['Date'].values,
+                y=chart_data['Success Rate'].values,
+                mode='lines'
+            ))
+            fig_success.update_layout(title='Success Rate Trend', xaxis_title='Date',
+                                      yaxis_title='Success Rate', uirevision='constant')
+            st.plotly_chart(fig_success, use_container_width=True, config=_PLOT_CONFIG)
         
         # Agent performance comparison
         agent_perf = pd.DataFrame({
@@ -647,14 +900,22 @@ class StreamlitApp:
         col1, col2 = st.columns(2)
         
         with col1:
-            fig_agent_tasks = px.bar(agent_perf, x='Agent', y='Tasks',
-                                   title='Tasks by Agent')
-            st.plotly_chart(fig_agent_tasks, use_container_width=True)
+            fig_agent_tasks = go.Figure(go.Bar(
+                x=agent_perf['Agent'].values,
+                y=agent_perf['Tasks'].values
+            ))
+            fig_agent_tasks.update_layout(title='Tasks by Agent', xaxis_title='Agent',
+                                          yaxis_title='Tasks', uirevision='constant')
+            st.plotly_chart(fig_agent_tasks, use_container_width=True, config=_PLOT_CONFIG)
         
         with col2:
-            fig_agent_time = px.bar(agent_perf, x='Agent', y='Avg Time (s)',
-                                  title='Average Response Time by Agent')
-            st.plotly_chart(fig_agent_time, use_container_width=True)
+            fig_agent_time = go.Figure(go.Bar(
+                x=agent_perf['Agent'].values,
+                y=agent_perf['Avg Time (s)'].values
+            ))
+            fig_agent_time.update_layout(title='Average Response Time by Agent', xaxis_title='Agent',
+                                         yaxis_title='Avg Time (s)', uirevision='constant')
+            st.plotly_chart(fig_agent_time, use_container_width=True, config=_PLOT_CONFIG)
 
 
 # Main entry point